@@ -731,6 +731,9 @@ def _jinja_env():
         trim_blocks=True,
         keep_trailing_newline=True,
         undefined=jinja2.StrictUndefined,
+        # Compiled templates persist across runs in a private per-user
+        # temp directory, keyed on each template's source checksum.
+        bytecode_cache=jinja2.FileSystemBytecodeCache(),
     )
     env.filters['rst_escape'] = _rst_escape
     env.filters['banner_alt_text'] = _banner_alt_text
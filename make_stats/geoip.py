@@ -1,5 +1,6 @@
 """GeoIP country lookup with persistent caching via ip-api.com."""
 
+import functools
 import json
 import os
 import sys
@@ -7,6 +8,11 @@ import time
 
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 _CACHE_FILE = os.path.join(_PROJECT_ROOT, 'geoip_cache.json')
 _TTL_DAYS = 30
@@ -16,9 +22,12 @@ _BATCH_SIZE = 100
 _BATCH_DELAY = 4  # seconds between batch requests (15 req/min limit)
 
 
+@functools.lru_cache(maxsize=256)
 def _country_flag(code: str) -> str:
     """Convert a 2-letter ISO country code to regional indicator emoji.
 
+    Cached, as a few hundred country codes repeat across every server.
+
     :param code: two-letter uppercase country code (e.g. ``'US'``)
     :returns: flag emoji string, or empty string if code is invalid
     """
@@ -34,8 +43,11 @@ def _load_cache() -> dict:
     """
     if not os.path.isfile(_CACHE_FILE):
         return {}
-    with open(_CACHE_FILE, 'r') as f:
-        return json.load(f)
+    with open(_CACHE_FILE, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def _save_cache(cache: dict) -> None:
@@ -43,20 +55,31 @@ def _save_cache(cache: dict) -> None:
 
     :param cache: dict mapping IP strings to cache entries
     """
-    with open(_CACHE_FILE + '.tmp', 'w') as f:
-        json.dump(cache, f, indent=1, sort_keys=True)
+    # Compact and sorted either way, so the file does not depend on
+    # whether orjson is installed.
+    if orjson is not None:
+        payload = orjson.dumps(cache, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(
+            cache, sort_keys=True, separators=(',', ':'),
+            ensure_ascii=False).encode()
+    with open(_CACHE_FILE + '.tmp', 'wb') as f:
+        f.write(payload)
     os.replace(_CACHE_FILE + '.tmp', _CACHE_FILE)
 
 
-def _query_batch(ips: list) -> dict:
+def _query_batch(ips: list, session=None) -> dict:
     """Query ip-api.com batch endpoint for a list of IPs.
 
     :param ips: list of IP address strings (max 100)
+    :param session: optional ``requests.Session`` whose connection is
+        reused across batches
     :returns: dict mapping IP -> (country_code, country_name)
     """
     payload = [{'query': ip, 'fields': 'query,status,country,countryCode'}
                for ip in ips]
-    resp = requests.post(_BATCH_URL, json=payload, timeout=30)
+    post = requests.post if session is None else session.post
+    resp = post(_BATCH_URL, json=payload, timeout=30)
     resp.raise_for_status()
     results = {}
     for entry in resp.json():
@@ -93,21 +116,30 @@ def lookup_countries(servers: list) -> None:
     print(f"GeoIP: {len(fresh)} cached, {len(stale)} to query",
           file=sys.stderr)
 
-    for i in range(0, len(stale), _BATCH_SIZE):
-        batch = stale[i:i + _BATCH_SIZE]
-        batch_num = i // _BATCH_SIZE + 1
-        total_batches = (len(stale) + _BATCH_SIZE - 1) // _BATCH_SIZE
-        print(f"  batch {batch_num}/{total_batches}"
-              f" ({len(batch)} IPs) ...", file=sys.stderr)
-        results = _query_batch(batch)
-        for ip, (code, name) in results.items():
-            cache[ip] = {'country': code, 'country_name': name,
-                         'ts': now}
-        if i + _BATCH_SIZE < len(stale):
-            time.sleep(_BATCH_DELAY)
-
-    if stale:
-        _save_cache(cache)
+    # Save once at the end, or after a failed batch so that the
+    # batches already answered need not be queried again.
+    try:
+        with requests.Session() as session:
+            for i in range(0, len(stale), _BATCH_SIZE):
+                batch = stale[i:i + _BATCH_SIZE]
+                batch_num = i // _BATCH_SIZE + 1
+                total_batches = (len(stale) + _BATCH_SIZE - 1) // _BATCH_SIZE
+                print(f"  batch {batch_num}/{total_batches}"
+                      f" ({len(batch)} IPs) ...", file=sys.stderr)
+                started = time.monotonic()
+                results = _query_batch(batch, session)
+                for ip, (code, name) in results.items():
+                    cache[ip] = {'country': code, 'country_name': name,
+                                 'ts': now}
+                if i + _BATCH_SIZE < len(stale):
+                    # The rate limit counts request starts, so the time
+                    # spent waiting on this response counts toward the
+                    # delay.
+                    time.sleep(
+                        max(0, started + _BATCH_DELAY - time.monotonic()))
+    finally:
+        if stale:
+            _save_cache(cache)
 
     for s in servers:
         ip = s.get('ip', '')
@@ -10,6 +10,7 @@ Requires: wezterm, xdotool, xwd, ImageMagick (convert), X11 DISPLAY.
 """
 
 import abc
+import functools
 import hashlib
 import os
 import shutil
@@ -77,9 +78,12 @@ _EAST_ASIAN_ENCODINGS = frozenset({
 })
 
 
+@functools.lru_cache(maxsize=64)
 def _encoding_to_font_group(encoding):
     """Map a server encoding to its font group name.
 
+    Cached, as only a handful of encodings occur across all banners.
+
     :param encoding: encoding string from scanner or server list
     :returns: font group key from ``_FONT_GROUPS``
     """
@@ -107,7 +111,7 @@ def _png_dimensions(path):
     :returns: ``(width, height)`` tuple, or ``(0, 0)`` on failure
     """
     try:
-        with open(path, 'rb') as fh:
+        with open(path, 'rb', buffering=0) as fh:
             header = fh.read(24)
         if len(header) >= 24 and header[:8] == b'\x89PNG\r\n\x1a\n':
             w, h = struct.unpack('>II', header[16:24])
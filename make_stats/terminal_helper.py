@@ -15,6 +15,7 @@ Usage::
 """
 
 import base64
+import errno
 import os
 import select
 import subprocess
@@ -104,20 +105,37 @@ def _log(msg):
     os.write(2, (msg + '\n').encode())
 
 
-def _signal_ready(ready_pipe, message):
+def _signal_ready(ready_pipe, message, timeout=30.0):
     """Write a status message to the ready FIFO.
 
+    The FIFO is opened without blocking, retrying until the renderer
+    opens its read end, so the helper cannot hang on a renderer that
+    has gone away.
+
     :param ready_pipe: path to the ready named pipe
     :param message: status string to send
+    :param timeout: maximum seconds to wait for a reader
     :returns: True if successfully written, False on error
     """
+    deadline = _monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(ready_pipe, os.O_WRONLY | os.O_NONBLOCK)
+            break
+        except OSError as exc:
+            # ENXIO: no reader has opened the FIFO yet.
+            if exc.errno != errno.ENXIO or _monotonic() >= deadline:
+                _log(f'ready signal failed: {exc}')
+                return False
+            time.sleep(0.01)
     try:
-        with open(ready_pipe, 'w') as f:
-            f.write(message + '\n')
+        os.write(fd, (message + '\n').encode())
         return True
     except OSError as exc:
         _log(f'ready signal failed: {exc}')
         return False
+    finally:
+        os.close(fd)
 
 
 def _set_user_var(name, value):
@@ -4,6 +4,7 @@ import hashlib
 import json
 import os
 import re
+import stat
 import struct
 import sys
 from pathlib import Path
@@ -13,6 +14,7 @@ import wcwidth
 from make_stats.common import _strip_ansi, _strip_mxp_sgml
 
 from .data import (
+    _write_list_lines,
     load_server_list,
     write_filtered_list,
     detect_failure_reason,
@@ -20,6 +22,16 @@ from .data import (
 from .encoding import _expunge_server_json
 from .util import _prompt
 
+# Byte-level prescans over raw fingerprint JSON, used to skip files
+# without a full parse.  A banner string value starting with a printable
+# ASCII character other than a quote or a JSON escape is certainly not
+# empty; a leading non-ASCII byte may begin Unicode whitespace, so those
+# files are parsed in full.  A file without any ESC character cannot
+# contain a banner made only of escape sequences.
+_NONEMPTY_BANNER_RE = re.compile(
+    rb'"banner_(?:before|after)_return":\s*"[^"\\\x00-\x20\x80-\xff]')
+_ESCAPE_RE = re.compile(rb'\\u001[bB]|\x1b')
+
 
 def _measure_banner_columns(text):
     """Measure visible line widths in banner text.
@@ -218,9 +230,8 @@ def review_column_width_issues(mud_issues, bbs_issues,
                     new_entries.append((h, p, line))
 
             if updated and not dry_run:
-                with open(list_path, 'w', encoding='utf-8') as f:
-                    for _, _, line in new_entries:
-                        f.write(line + '\n')
+                _write_list_lines(
+                    list_path, [line for _, _, line in new_entries])
                 print(f"    \u2713 Updated {list_path}"
                       f" ({columns} columns)")
                 applied_count += 1
@@ -256,10 +267,16 @@ def discover_empty_banners(data_dir, list_path, logs_dir):
                 continue
             fpath = os.path.join(fp_path, fname)
             try:
-                with open(fpath, encoding='utf-8',
-                          errors='surrogateescape') as f:
-                    data = json.load(f)
-            except (OSError, json.JSONDecodeError):
+                with open(fpath, 'rb') as f:
+                    raw = f.read()
+            except OSError:
+                continue
+            if _NONEMPTY_BANNER_RE.search(raw):
+                continue
+            try:
+                data = json.loads(
+                    raw.decode('utf-8', errors='surrogateescape'))
+            except json.JSONDecodeError:
                 continue
 
             probe = data.get('server-probe', {})
@@ -449,10 +466,16 @@ def discover_renders_empty(data_dir, list_path):
                 continue
             fpath = os.path.join(fp_path, fname)
             try:
-                with open(fpath, encoding='utf-8',
-                          errors='surrogateescape') as f:
-                    data = json.load(f)
-            except (OSError, json.JSONDecodeError):
+                with open(fpath, 'rb') as f:
+                    raw = f.read()
+            except OSError:
+                continue
+            if not _ESCAPE_RE.search(raw):
+                continue
+            try:
+                data = json.loads(
+                    raw.decode('utf-8', errors='surrogateescape'))
+            except json.JSONDecodeError:
                 continue
 
             probe = data.get('server-probe', {})
@@ -530,6 +553,7 @@ def review_renders_empty(mud_issues, bbs_issues, mud_list, bbs_list,
               f" screen: {len(issues)} ---")
         removals = set()
         rescans = 0
+        pending_expunge = []
 
         for issue in issues:
             host = issue['host']
@@ -561,15 +585,15 @@ def review_renders_empty(mud_issues, bbs_issues, mud_list, bbs_list,
                           f" {log_file}")
                 else:
                     print(f"    no log file to delete")
-                if data_dir and not dry_run:
-                    nj = _expunge_server_json(
-                        data_dir, [(host, port)])
-                    if nj:
-                        print(f"    deleted {nj} data file(s)")
+                pending_expunge.append((host, port))
                 rescans += 1
             elif choice == 'y':
                 removals.add((host, port))
 
+        if pending_expunge and data_dir and not dry_run:
+            nj = _expunge_server_json(data_dir, pending_expunge)
+            if nj:
+                print(f"  deleted {nj} data file(s)")
         if removals:
             entries = load_server_list(list_path)
             write_filtered_list(list_path, entries, removals,
@@ -792,6 +816,35 @@ def discover_renders_small(data_dir, list_path, banners_dir,
     return issues
 
 
+def _open_dir_fd(path):
+    """Open a directory for use as a ``dir_fd`` argument.
+
+    :param path: directory path
+    :returns: file descriptor, or None if the directory can't be opened
+    """
+    try:
+        return os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return None
+
+
+def _is_file_at(dir_fd, name):
+    """Check whether *name* is a regular file relative to *dir_fd*.
+
+    :param dir_fd: directory file descriptor from :func:`_open_dir_fd`,
+        or None
+    :param name: file name within that directory
+    :returns: True if a regular file exists
+    """
+    if dir_fd is None:
+        return False
+    try:
+        st = os.stat(name, dir_fd=dir_fd, follow_symlinks=False)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode)
+
+
 def review_renders_small(mud_issues, bbs_issues, mud_list, bbs_list,
                          logs_dir, mud_data=None, bbs_data=None,
                          report_only=False, dry_run=False):
@@ -827,68 +880,74 @@ def review_renders_small(mud_issues, bbs_issues, mud_list, bbs_list,
               f"{len(issues)} ---")
         removals = set()
         rescans = 0
+        pending_expunge = []
+        png_fd = _open_dir_fd(os.path.dirname(issues[0]['png_path']))
+        logs_fd = _open_dir_fd(str(logs_dir))
+        try:
+            for issue in issues:
+                host = issue['host']
+                port = issue['port']
+                file_size = issue['file_size']
+                pixel_w = issue['pixel_width']
+                pixel_h = issue['pixel_height']
+                raw = issue['raw_banner']
+                png_path = issue['png_path']
+
+                reason = issue['reason']
+                n_lines = issue['visible_lines']
+                dims = (f"{pixel_w}x{pixel_h}"
+                        if pixel_w is not None else "unknown")
+                print(f"\n  {host}:{port}  [{reason}]")
+                print(f"    PNG: {file_size} bytes, {dims} pixels, "
+                      f"{n_lines} visible line(s)")
+                raw_repr = repr(raw)
+                if len(raw_repr) > 500:
+                    raw_repr = raw_repr[:500] + '...'
+                print(f"    Raw banner ({len(raw)} chars):"
+                      f" {raw_repr}")
+
+                if report_only:
+                    continue
 
-        for issue in issues:
-            host = issue['host']
-            port = issue['port']
-            file_size = issue['file_size']
-            pixel_w = issue['pixel_width']
-            pixel_h = issue['pixel_height']
-            raw = issue['raw_banner']
-            png_path = issue['png_path']
-
-            reason = issue['reason']
-            n_lines = issue['visible_lines']
-            dims = (f"{pixel_w}x{pixel_h}"
-                    if pixel_w is not None else "unknown")
-            print(f"\n  {host}:{port}  [{reason}]")
-            print(f"    PNG: {file_size} bytes, {dims} pixels, "
-                  f"{n_lines} visible line(s)")
-            raw_repr = repr(raw)
-            if len(raw_repr) > 500:
-                raw_repr = raw_repr[:500] + '...'
-            print(f"    Raw banner ({len(raw)} chars):"
-                  f" {raw_repr}")
-
-            if report_only:
-                continue
-
-            choice = _prompt(
-                "    [x]expunge / [d]elete PNG + expunge / "
-                "[y]remove from list / [N]skip / [q]uit? ",
-                "xdynq")
-            if choice == 'q':
-                break
-            if choice in ('x', 'd'):
-                if choice == 'd':
-                    if not dry_run:
-                        if os.path.isfile(png_path):
-                            os.unlink(png_path)
-                            print(f"    deleted {png_path}")
-                    else:
+                choice = _prompt(
+                    "    [x]expunge / [d]elete PNG + expunge / "
+                    "[y]remove from list / [N]skip / [q]uit? ",
+                    "xdynq")
+                if choice == 'q':
+                    break
+                if choice in ('x', 'd'):
+                    if choice == 'd':
+                        png_name = os.path.basename(png_path)
+                        if not dry_run:
+                            if _is_file_at(png_fd, png_name):
+                                os.unlink(png_name, dir_fd=png_fd)
+                                print(f"    deleted {png_path}")
+                        else:
+                            print(f"    [dry-run] would delete"
+                                  f" {png_path}")
+                    log_name = f"{host}:{port}.log"
+                    log_file = Path(logs_dir) / log_name
+                    if _is_file_at(logs_fd, log_name) and not dry_run:
+                        os.unlink(log_name, dir_fd=logs_fd)
+                        print(f"    deleted {log_file}")
+                    elif _is_file_at(logs_fd, log_name):
                         print(f"    [dry-run] would delete"
-                              f" {png_path}")
-                log_file = (
-                    Path(logs_dir) / f"{host}:{port}.log"
-                )
-                if log_file.is_file() and not dry_run:
-                    log_file.unlink()
-                    print(f"    deleted {log_file}")
-                elif log_file.is_file():
-                    print(f"    [dry-run] would delete"
-                          f" {log_file}")
-                else:
-                    print(f"    no log file to delete")
-                if data_dir and not dry_run:
-                    nj = _expunge_server_json(
-                        data_dir, [(host, port)])
-                    if nj:
-                        print(f"    deleted {nj}"
-                              f" data file(s)")
-                rescans += 1
-            elif choice == 'y':
-                removals.add((host, port))
-
+                              f" {log_file}")
+                    else:
+                        print(f"    no log file to delete")
+                    pending_expunge.append((host, port))
+                    rescans += 1
+                elif choice == 'y':
+                    removals.add((host, port))
+        finally:
+            for fd in (png_fd, logs_fd):
+                if fd is not None:
+                    os.close(fd)
+
+        if pending_expunge and data_dir and not dry_run:
+            nj = _expunge_server_json(data_dir, pending_expunge)
+            if nj:
+                print(f"  deleted {nj} data file(s)")
         if removals:
             entries = load_server_list(list_path)
             write_filtered_list(list_path, entries, removals,
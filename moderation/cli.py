@@ -4,29 +4,7 @@ import argparse
 import os
 from pathlib import Path
 
-from .banner_analysis import (
-    discover_column_width_issues,
-    discover_empty_banners,
-    discover_renders_empty,
-    discover_renders_small,
-    review_column_width_issues,
-    review_empty_banners,
-    review_renders_empty,
-    review_renders_small,
-)
 from .decisions import load_decisions, record_rejections, save_decisions
-from .dedup import (
-    find_cross_list_conflicts,
-    find_dns_duplicates,
-    find_duplicates,
-    prune_dead,
-)
-from .encoding import (
-    discover_encoding_issues,
-    expunge_all_logs,
-    review_encoding_issues,
-    show_all_banners,
-)
 from .util import (
     DEFAULT_BBS_DATA,
     DEFAULT_BBS_LIST,
@@ -38,8 +16,42 @@ from .util import (
 )
 
 
-def _get_argument_parser():
-    """Build argument parser."""
+def _positive_int(value):
+    """Parse a strictly positive integer command-line value.
+
+    :param value: argument string
+    :returns: the parsed integer
+    :raises argparse.ArgumentTypeError: if *value* is not an integer
+        greater than zero
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            f"must be a positive integer: {value!r}")
+    return number
+
+
+def _get_bulk_parser():
+    """Build a minimal pre-parser that detects bulk operations.
+
+    :returns: parser recognizing only ``--show-all`` and
+        ``--expunge-all``
+    """
+    parser = argparse.ArgumentParser(add_help=False, exit_on_error=False)
+    parser.add_argument("--show-all")
+    parser.add_argument("--expunge-all")
+    return parser
+
+
+def _get_argument_parser(bulk=False):
+    """Build argument parser.
+
+    :param bulk: if True, build only the arguments used by the
+        ``--show-all`` and ``--expunge-all`` bulk operations
+    """
     parser = argparse.ArgumentParser(
         description=(
             "Moderate MUD and BBS server lists: prune dead"
@@ -60,6 +72,62 @@ def _get_argument_parser():
         help="only moderate the BBS list",
     )
 
+    if not bulk:
+        _add_mode_arguments(parser)
+
+    parser.add_argument(
+        "--show-all", metavar="ENCODING",
+        help=("display raw banners for all servers with the"
+              " given encoding (or 'all' for every encoding)"),
+    )
+    parser.add_argument(
+        "--expunge-all", metavar="ENCODING",
+        help=("delete log files for all servers with the"
+              " given encoding (or 'all' for every encoding),"
+              " allowing re-scan"),
+    )
+
+    if not bulk:
+        _add_review_arguments(parser)
+
+    paths = parser.add_argument_group("paths")
+    paths.add_argument(
+        "--mud-list", default=str(DEFAULT_MUD_LIST),
+        help=f"path to MUD server list"
+             f" (default: {DEFAULT_MUD_LIST})",
+    )
+    paths.add_argument(
+        "--bbs-list", default=str(DEFAULT_BBS_LIST),
+        help=f"path to BBS server list"
+             f" (default: {DEFAULT_BBS_LIST})",
+    )
+    paths.add_argument(
+        "--mud-data", default=str(DEFAULT_MUD_DATA),
+        help=f"MUD data directory, containing server/"
+             f" subdirectory (default: {DEFAULT_MUD_DATA})",
+    )
+    paths.add_argument(
+        "--bbs-data", default=str(DEFAULT_BBS_DATA),
+        help=f"BBS data directory, containing server/"
+             f" subdirectory (default: {DEFAULT_BBS_DATA})",
+    )
+    paths.add_argument(
+        "--logs", default=str(DEFAULT_LOGS),
+        help=f"shared logs directory"
+             f" (default: {DEFAULT_LOGS})",
+    )
+    if not bulk:
+        paths.add_argument(
+            "--decisions", default=str(DEFAULT_DECISIONS),
+            help=f"decisions cache file"
+                 f" (default: {DEFAULT_DECISIONS})",
+        )
+
+    return parser
+
+
+def _add_mode_arguments(parser):
+    """Add the mutually exclusive ``--only-*`` mode flags."""
     mode = parser.add_argument_group("mode (default: all)")
     mode_mx = mode.add_mutually_exclusive_group()
     mode_mx.add_argument(
@@ -102,6 +170,9 @@ def _get_argument_parser():
               " are tiny (<1KB)"),
     )
 
+
+def _add_review_arguments(parser):
+    """Add options that only affect interactive review modes."""
     parser.add_argument(
         "--report-only", action="store_true",
         help="print report without interactive prompts",
@@ -115,15 +186,8 @@ def _get_argument_parser():
         help="show what would change without writing files",
     )
     parser.add_argument(
-        "--show-all", metavar="ENCODING",
-        help=("display raw banners for all servers with the"
-              " given encoding (or 'all' for every encoding)"),
-    )
-    parser.add_argument(
-        "--expunge-all", metavar="ENCODING",
-        help=("delete log files for all servers with the"
-              " given encoding (or 'all' for every encoding),"
-              " allowing re-scan"),
+        "--top-n", type=_positive_int, metavar="N",
+        help="review or report only the N largest duplicate groups",
     )
     parser.add_argument(
         "--batch-cross", action="store_true",
@@ -137,66 +201,48 @@ def _get_argument_parser():
     )
     parser.add_argument(
         "--no-cache", action="store_true",
-        help="ignore cached decisions, re-prompt everything",
+        help=("ignore cached decisions, re-prompt everything;"
+              " also skips the DNS cache, as does --report-only"),
     )
 
-    paths = parser.add_argument_group("paths")
-    paths.add_argument(
-        "--mud-list", default=str(DEFAULT_MUD_LIST),
-        help=f"path to MUD server list"
-             f" (default: {DEFAULT_MUD_LIST})",
-    )
-    paths.add_argument(
-        "--bbs-list", default=str(DEFAULT_BBS_LIST),
-        help=f"path to BBS server list"
-             f" (default: {DEFAULT_BBS_LIST})",
-    )
-    paths.add_argument(
-        "--mud-data", default=str(DEFAULT_MUD_DATA),
-        help=f"MUD data directory, containing server/"
-             f" subdirectory (default: {DEFAULT_MUD_DATA})",
-    )
-    paths.add_argument(
-        "--bbs-data", default=str(DEFAULT_BBS_DATA),
-        help=f"BBS data directory, containing server/"
-             f" subdirectory (default: {DEFAULT_BBS_DATA})",
-    )
-    paths.add_argument(
-        "--logs", default=str(DEFAULT_LOGS),
-        help=f"shared logs directory"
-             f" (default: {DEFAULT_LOGS})",
-    )
-    paths.add_argument(
-        "--decisions", default=str(DEFAULT_DECISIONS),
-        help=f"decisions cache file"
-             f" (default: {DEFAULT_DECISIONS})",
-    )
-
-    return parser
-
 
 def main():
-    """CLI entry point."""
-    args = _get_argument_parser().parse_args()
+    """CLI entry point.
+
+    Analysis modules are imported only by the modes that use them, so
+    that ``--help`` and single-mode runs skip their import cost.
+    """
+    try:
+        pre_args, _ = _get_bulk_parser().parse_known_args()
+        bulk = bool(pre_args.show_all or pre_args.expunge_all)
+    except argparse.ArgumentError:
+        bulk = False
+    args = _get_argument_parser(bulk=bulk).parse_args()
 
     do_mud = not args.bbs
     do_bbs = not args.mud
+    # Moderation steps rewrite the lists but never create or delete
+    # them, so existence is checked once up front.
+    mud_exists = os.path.isfile(args.mud_list)
+    bbs_exists = os.path.isfile(args.bbs_list)
 
     if args.show_all:
-        if do_mud and os.path.isfile(args.mud_list):
+        from .encoding import show_all_banners
+        if do_mud and mud_exists:
             show_all_banners(
                 args.mud_list, args.mud_data, args.show_all)
-        if do_bbs and os.path.isfile(args.bbs_list):
+        if do_bbs and bbs_exists:
             show_all_banners(
                 args.bbs_list, args.bbs_data, args.show_all)
         return
 
     if args.expunge_all:
-        if do_mud and os.path.isfile(args.mud_list):
+        from .encoding import expunge_all_logs
+        if do_mud and mud_exists:
             expunge_all_logs(
                 args.mud_list, args.logs, args.expunge_all,
                 data_dir=args.mud_data)
-        if do_bbs and os.path.isfile(args.bbs_list):
+        if do_bbs and bbs_exists:
             expunge_all_logs(
                 args.bbs_list, args.logs, args.expunge_all,
                 data_dir=args.bbs_data)
@@ -232,12 +278,15 @@ def main():
         decisions = load_decisions(args.decisions)
 
     if do_dns:
-        if (os.path.isfile(args.mud_list)
-                and os.path.isfile(args.bbs_list)):
+        from .dedup import find_dns_duplicates
+        if mud_exists and bbs_exists:
             mud_rm, bbs_rm = find_dns_duplicates(
                 args.mud_list, args.bbs_list,
                 report_only=args.report_only,
-                dry_run=args.dry_run)
+                dry_run=args.dry_run,
+                cache_path=(
+                    os.path.join(args.mud_data, ".dns_cache.json")
+                    if decisions is not None else None))
             if decisions and not args.dry_run:
                 record_rejections(
                     decisions, "mud", mud_rm, "dns")
@@ -245,7 +294,8 @@ def main():
                     decisions, "bbs", bbs_rm, "dns")
 
     if do_prune:
-        if do_mud and os.path.isfile(args.mud_list):
+        from .dedup import prune_dead
+        if do_mud and mud_exists:
             removed = prune_dead(
                 args.mud_list, args.mud_data, args.logs,
                 report_only=args.report_only,
@@ -253,7 +303,7 @@ def main():
             if decisions and not args.dry_run:
                 record_rejections(
                     decisions, "mud", removed, "dead")
-        if do_bbs and os.path.isfile(args.bbs_list):
+        if do_bbs and bbs_exists:
             removed = prune_dead(
                 args.bbs_list, args.bbs_data, args.logs,
                 report_only=args.report_only,
@@ -263,32 +313,35 @@ def main():
                     decisions, "bbs", removed, "dead")
 
     if do_dupes:
-        if do_mud and os.path.isfile(args.mud_list):
+        from .dedup import find_duplicates
+        if do_mud and mud_exists:
             removed = find_duplicates(
                 args.mud_list, args.mud_data,
                 report_only=args.report_only,
                 prune_data=args.prune_data,
                 dry_run=args.dry_run,
                 decisions=decisions,
-                logs_dir=args.logs)
+                logs_dir=args.logs,
+                top_n=args.top_n)
             if decisions and not args.dry_run:
                 record_rejections(
                     decisions, "mud", removed, "duplicate")
-        if do_bbs and os.path.isfile(args.bbs_list):
+        if do_bbs and bbs_exists:
             removed = find_duplicates(
                 args.bbs_list, args.bbs_data,
                 report_only=args.report_only,
                 prune_data=args.prune_data,
                 dry_run=args.dry_run,
                 decisions=decisions,
-                logs_dir=args.logs)
+                logs_dir=args.logs,
+                top_n=args.top_n)
             if decisions and not args.dry_run:
                 record_rejections(
                     decisions, "bbs", removed, "duplicate")
 
     if do_cross:
-        if (os.path.isfile(args.mud_list)
-                and os.path.isfile(args.bbs_list)):
+        from .dedup import find_cross_list_conflicts
+        if mud_exists and bbs_exists:
             mud_rm, bbs_rm = find_cross_list_conflicts(
                 args.mud_list, args.bbs_list,
                 args.mud_data, args.bbs_data,
@@ -303,12 +356,14 @@ def main():
                     decisions, "bbs", bbs_rm, "cross")
 
     if do_encodings:
+        from .encoding import (
+            discover_encoding_issues, review_encoding_issues)
         mud_issues = []
         bbs_issues = []
-        if do_mud and os.path.isfile(args.mud_list):
+        if do_mud and mud_exists:
             mud_issues = discover_encoding_issues(
                 args.mud_data, args.mud_list)
-        if do_bbs and os.path.isfile(args.bbs_list):
+        if do_bbs and bbs_exists:
             bbs_issues = discover_encoding_issues(
                 args.bbs_data, args.bbs_list,
                 default_encoding='cp437')
@@ -325,12 +380,14 @@ def main():
             print("No encoding issues detected.")
 
     if do_columns:
+        from .banner_analysis import (
+            discover_column_width_issues, review_column_width_issues)
         mud_issues = []
         bbs_issues = []
-        if do_mud and os.path.isfile(args.mud_list):
+        if do_mud and mud_exists:
             mud_issues = discover_column_width_issues(
                 args.mud_data, args.mud_list)
-        if do_bbs and os.path.isfile(args.bbs_list):
+        if do_bbs and bbs_exists:
             bbs_issues = discover_column_width_issues(
                 args.bbs_data, args.bbs_list)
 
@@ -344,12 +401,14 @@ def main():
             print("No column width issues detected.")
 
     if do_empty:
+        from .banner_analysis import (
+            discover_empty_banners, review_empty_banners)
         mud_issues = []
         bbs_issues = []
-        if do_mud and os.path.isfile(args.mud_list):
+        if do_mud and mud_exists:
             mud_issues = discover_empty_banners(
                 args.mud_data, args.mud_list, args.logs)
-        if do_bbs and os.path.isfile(args.bbs_list):
+        if do_bbs and bbs_exists:
             bbs_issues = discover_empty_banners(
                 args.bbs_data, args.bbs_list, args.logs)
 
@@ -365,12 +424,14 @@ def main():
             print("No empty banner issues detected.")
 
     if do_renders_empty:
+        from .banner_analysis import (
+            discover_renders_empty, review_renders_empty)
         mud_issues = []
         bbs_issues = []
-        if do_mud and os.path.isfile(args.mud_list):
+        if do_mud and mud_exists:
             mud_issues = discover_renders_empty(
                 args.mud_data, args.mud_list)
-        if do_bbs and os.path.isfile(args.bbs_list):
+        if do_bbs and bbs_exists:
             bbs_issues = discover_renders_empty(
                 args.bbs_data, args.bbs_list)
 
@@ -386,6 +447,8 @@ def main():
             print("No banners that render to empty screen.")
 
     if do_renders_small:
+        from .banner_analysis import (
+            discover_renders_small, review_renders_small)
         mud_banners = (
             _HERE / "docs-muds" / "_static" / "banners"
         )
@@ -394,12 +457,12 @@ def main():
         )
         mud_issues = []
         bbs_issues = []
-        if do_mud and os.path.isfile(args.mud_list):
+        if do_mud and mud_exists:
             mud_issues = discover_renders_small(
                 args.mud_data, args.mud_list,
                 str(mud_banners),
                 default_encoding=None)
-        if do_bbs and os.path.isfile(args.bbs_list):
+        if do_bbs and bbs_exists:
             bbs_issues = discover_renders_small(
                 args.bbs_data, args.bbs_list,
                 str(bbs_banners),
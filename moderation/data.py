@@ -1,38 +1,104 @@
 """Server list I/O and fingerprint data loading."""
 
+import dataclasses
+import functools
 import json
+import mmap
+import operator
 import os
 import re
+import stat
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .util import _banner_hash
 
+# Server list entry: host and numeric port as the first two fields.
+_ENTRY_RE = re.compile(r"\s*([^\s#]\S*)\s+(\d+)(?!\S)")
+
+# Below this many JSON files, process pool start-up outweighs the
+# parallel speedup in load_server_records().
+_PARALLEL_MIN_FILES = 200
+
+# Record fields whose equal values are shared by _share_values().
+_SHARED_FIELDS = (
+    "ip", "fingerprint", "banner_hash", "banner_before", "banner_after",
+    "mssp_name", "encoding",
+)
+
+# Scan log failure signatures, highest priority first.  Each is searched
+# separately so that a match for one reason can never consume the text of
+# a higher-priority one on the same line.
+_FAILURE_PATTERNS = tuple(
+    (reason, re.compile(pattern.encode("ascii"), re.IGNORECASE))
+    for reason, pattern in (
+        ("connection timed out", r"timed out"),
+        ("connection refused", r"connection refused"),
+        ("DNS resolution failed",
+         r"no address.*associated|name or service not known"
+         r"|name.*not resolve|getaddrinfo"),
+        ("network unreachable", r"network is unreachable|no route to host"),
+        ("error (see log)", r"error|exception|fail"),
+    )
+)
+
+# Prefault mapped log pages where the platform supports it.
+_MAP_POPULATE = getattr(mmap, "MAP_POPULATE", 0)
+
+# Parsed server lists keyed by absolute path, each stored with the
+# (inode, mtime, size) stamp of the file it was parsed from.
+_LIST_CACHE = {}
+
+
+def _list_cache_key(path):
+    """Return the cache key for a server list path."""
+    return os.path.abspath(os.fspath(path))
+
+
+def _invalidate_server_list(path):
+    """Drop a cached parse after *path* has been rewritten.
+
+    :param path: path to server list file
+    """
+    _LIST_CACHE.pop(_list_cache_key(path), None)
+
 
 def load_server_list(path):
     """Load a server list, preserving original lines.
 
+    Parsed results are cached until the file's inode, modification
+    time or size changes, or until :func:`_invalidate_server_list`.
+
     :param path: path to server list file
     :returns: list of (host, port, original_line) tuples;
               host/port are None for comments and blank lines
     """
+    key = _list_cache_key(path)
+    st = os.stat(key)
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _LIST_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return list(cached[1])
+
+    with open(key, encoding="utf-8") as f:
+        lines = f.read().split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    match = _ENTRY_RE.match
     entries = []
-    with open(path, encoding="utf-8") as f:
-        for line in f:
-            line = line.rstrip("\n")
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
-                entries.append((None, None, line))
-                continue
-            parts = stripped.split()
-            if len(parts) >= 2:
-                try:
-                    port = int(parts[1])
-                    entries.append((parts[0], port, line))
-                    continue
-                except ValueError:
-                    pass
+    for line in lines:
+        m = match(line)
+        if m:
+            entries.append((m.group(1), int(m.group(2)), line))
+        else:
             entries.append((None, None, line))
-    return entries
+    _LIST_CACHE[key] = (stamp, entries)
+    return list(entries)
 
 
 def _parse_host_port_set(path):
@@ -48,6 +114,56 @@ def _parse_host_port_set(path):
     return result
 
 
+def _replace_file(path, payload):
+    """Durably replace *path* with *payload*.
+
+    The bytes are written in one buffer to a ``.new`` sibling and
+    fsynced before it replaces *path*; the parent directory is then
+    fsynced so the rename itself survives a crash.  Nothing is written
+    when *path* already holds exactly *payload*.
+
+    :param path: file path to replace
+    :param payload: complete file contents, as bytes
+    """
+    try:
+        if os.path.getsize(path) == len(payload):
+            with open(path, "rb") as f:
+                if f.read() == payload:
+                    return
+    except OSError:
+        pass
+    output = str(path) + ".new"
+    fd = os.open(output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(output, path)
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(os.path.dirname(os.path.abspath(path)),
+                         os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+
+def _write_list_lines(path, lines):
+    """Atomically replace a server list file with the given lines.
+
+    :param path: server list file path
+    :param lines: iterable of line strings, without newlines
+    """
+    _replace_file(path, "".join(
+        f"{line}\n" for line in lines).encode("utf-8"))
+    _invalidate_server_list(path)
+
+
 def write_filtered_list(path, entries, removals, dry_run=False):
     """Write filtered server list, excluding removed entries.
 
@@ -66,7 +182,7 @@ def write_filtered_list(path, entries, removals, dry_run=False):
         if host is not None and (host.lower(), port) in removals_lower:
             removed += 1
             continue
-        lines.append(original + "\n")
+        lines.append(original)
         if host is not None:
             kept += 1
 
@@ -75,79 +191,208 @@ def write_filtered_list(path, entries, removals, dry_run=False):
               f" kept {kept}, removed {removed}")
         return removed
 
-    with open(output, "w", encoding="utf-8") as f:
-        f.writelines(lines)
-
-    os.replace(output, path)
+    _write_list_lines(path, lines)
     print(f"  wrote {path}: kept {kept}, removed {removed}")
     return removed
 
 
+def _read_json(path):
+    """Read and decode a JSON file, using orjson when it is installed.
+
+    Files that orjson rejects, such as lone surrogate escapes written
+    for undecodable banner bytes, are decoded again with :mod:`json`,
+    with invalid UTF-8 kept as surrogate escapes.
+
+    :param path: path to a JSON file
+    :returns: decoded object
+    :raises OSError: if the file can't be read
+    :raises json.JSONDecodeError: if the file is not valid JSON
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8", errors="surrogateescape"))
+
+
+def _iter_json_paths(server_dir, ordered=False):
+    """Yield ``*/*.json`` file paths under a server directory.
+
+    :param server_dir: path to the ``server/`` directory
+    :param ordered: if True, yield in name order; otherwise paths are
+        yielded in directory order, without sorting
+    :returns: iterator of path strings
+    """
+    try:
+        with os.scandir(server_dir) as it:
+            fp_dirs = [e.path for e in it if e.is_dir()]
+    except OSError:
+        return
+    if ordered:
+        fp_dirs.sort()
+    for fp_path in fp_dirs:
+        try:
+            with os.scandir(fp_path) as it:
+                paths = [e.path for e in it
+                         if e.name.endswith(".json") and e.is_file()]
+        except OSError:
+            continue
+        if ordered:
+            paths.sort()
+        yield from paths
+
+
+@dataclasses.dataclass(slots=True)
+class ServerRecord:
+    """One scanned session of a server, from a fingerprint JSON file."""
+
+    host: str
+    port: int
+    ip: str
+    connected: str
+    fingerprint: str
+    fp_data: dict
+    banner_hash: str
+    banner_before: str
+    banner_after: str
+    mssp_name: str
+    encoding: str
+    data_path: str
+    #: ``(host.lower(), port)``, the key used to match list entries.
+    addr: tuple
+    #: Position in the record list under analysis, see
+    #: :func:`~.dedup.find_duplicates`.
+    index: int = -1
+
+
+def _banner_text(value):
+    """Return banner text from a session banner field.
+
+    Newer scans store banners as ``{"text": ...}`` dicts.
+
+    :param value: banner field value, a string, dict or None
+    :returns: banner text, ``""`` when missing
+    """
+    if type(value) is dict:
+        return value.get("text", "") or ""
+    return value or ""
+
+
+def _parse_record_file(path):
+    """Parse one server JSON file into records, one per session.
+
+    :param path: path to a fingerprint JSON file
+    :returns: list of :class:`ServerRecord`, empty if the file can't
+        be read
+    """
+    try:
+        data = _read_json(path)
+    except (OSError, json.JSONDecodeError):
+        return []
+    probe = data.get("server-probe", {})
+    fingerprint = probe.get("fingerprint", "")
+    fp_data = probe.get("fingerprint-data", {})
+    session_data = probe.get("session_data", {})
+
+    banner_before = _banner_text(session_data.get("banner_before_return"))
+    banner_after = _banner_text(session_data.get("banner_after_return"))
+    banner_hash = _banner_hash(banner_before + banner_after)
+    mssp = session_data.get("mssp", {})
+    mssp_name = mssp.get("NAME", "") if isinstance(mssp, dict) else ""
+
+    records = []
+    for session in data.get("sessions", []):
+        host = session.get("host", "")
+        port = session.get("port", 0)
+        records.append(ServerRecord(
+            host=host,
+            port=port,
+            ip=session.get("ip", ""),
+            connected=session.get("connected", ""),
+            fingerprint=fingerprint,
+            fp_data=fp_data,
+            banner_hash=banner_hash,
+            banner_before=banner_before,
+            banner_after=banner_after,
+            mssp_name=mssp_name,
+            encoding=session_data.get("encoding", ""),
+            data_path=path,
+            addr=(host.lower(), port),
+        ))
+    return records
+
+
 def load_server_records(data_dir):
-    """Load all server JSON files, return list of record dicts.
+    """Load all server JSON files, return list of server records.
+
+    Files are read in directory order.  Large data directories are
+    parsed across a process pool.
 
     :param data_dir: path containing a ``server/`` subdirectory
-    :returns: list of record dicts
+    :returns: list of :class:`ServerRecord`
     """
+    paths = list(_iter_json_paths(os.path.join(data_dir, "server")))
     records = []
-    server_dir = data_dir / "server"
-    if not server_dir.is_dir():
-        return records
-    for path in sorted(server_dir.glob("*/*.json")):
-        try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-        except (OSError, json.JSONDecodeError):
-            continue
-        probe = data.get("server-probe", {})
-        fingerprint = probe.get("fingerprint", "")
-        fp_data = probe.get("fingerprint-data", {})
-        session_data = probe.get("session_data", {})
-
-        banner_before = session_data.get("banner_before_return", "")
-        banner_after = session_data.get("banner_after_return", "")
-        if isinstance(banner_before, dict):
-            banner_before = banner_before.get("text", "")
-        if isinstance(banner_after, dict):
-            banner_after = banner_after.get("text", "")
-        combined = (banner_before or "") + (banner_after or "")
-
-        mssp = session_data.get("mssp", {})
-        mssp_name = (
-            mssp.get("NAME", "") if isinstance(mssp, dict) else ""
-        )
-
-        for session in data.get("sessions", []):
-            records.append({
-                "host": session.get("host", ""),
-                "port": session.get("port", 0),
-                "ip": session.get("ip", ""),
-                "connected": session.get("connected", ""),
-                "fingerprint": fingerprint,
-                "fp_data": fp_data,
-                "banner_hash": _banner_hash(combined),
-                "banner_before": banner_before,
-                "banner_after": banner_after,
-                "mssp_name": mssp_name,
-                "encoding": session_data.get("encoding", ""),
-                "data_path": str(path),
-            })
+    if len(paths) < _PARALLEL_MIN_FILES:
+        for path in paths:
+            records.extend(_parse_record_file(path))
+    else:
+        with ProcessPoolExecutor() as pool:
+            for recs in pool.map(_parse_record_file, paths, chunksize=32):
+                records.extend(recs)
+    _share_values(records)
     return records
 
 
+def _share_values(records):
+    """Make equal field values across records share a single object.
+
+    Sessions parsed from the same file already share their values, but
+    many files repeat the same IP address, fingerprint, encoding, MSSP
+    name and banner text.  Shared strings also make the dict lookups
+    when grouping by these fields succeed on an identity check.
+    Records may still be updated afterwards, but shared values such as
+    the ``fp_data`` dicts must not be mutated in place.
+
+    :param records: list of :class:`ServerRecord`, updated in place
+    """
+    strings = {}
+    fp_data_by_fp = {}
+    for rec in records:
+        for field in _SHARED_FIELDS:
+            value = getattr(rec, field)
+            if isinstance(value, str):
+                setattr(rec, field, strings.setdefault(value, value))
+        fp_data = rec.fp_data
+        shared = fp_data_by_fp.setdefault(rec.fingerprint, fp_data)
+        if shared is not fp_data and shared == fp_data:
+            rec.fp_data = shared
+
+
 def deduplicate_records(records):
     """Keep only the most recent record per (host, port).
 
-    :param records: list of record dicts
+    :param records: list of :class:`ServerRecord`
     :returns: deduplicated list
     """
     by_hp = {}
     for rec in records:
-        key = (rec["host"], rec["port"])
-        existing = by_hp.get(key)
-        if existing is None or rec["connected"] > existing["connected"]:
-            by_hp[key] = rec
-    return list(by_hp.values())
+        by_hp.setdefault((rec.host, rec.port), []).append(rec)
+    result = []
+    for group in by_hp.values():
+        if len(group) == 1:
+            result.append(group[0])
+            continue
+        # Ties on the connect time go to the first data file by path,
+        # so the result does not depend on directory order.
+        latest = max(rec.connected for rec in group)
+        result.append(min(
+            (rec for rec in group if rec.connected == latest),
+            key=operator.attrgetter("data_path")))
+    return result
 
 
 def build_alive_set(data_dir):
@@ -158,56 +403,63 @@ def build_alive_set(data_dir):
     :returns: set of ``"host port"`` strings
     """
     alive = set()
-    if not os.path.isdir(data_dir):
-        return alive
-    for fp_dir in sorted(os.listdir(data_dir)):
-        fp_path = os.path.join(data_dir, fp_dir)
-        if not os.path.isdir(fp_path):
+    for fpath in _iter_json_paths(data_dir):
+        try:
+            data = _read_json(fpath)
+        except (json.JSONDecodeError, OSError):
             continue
-        for fname in sorted(os.listdir(fp_path)):
-            if not fname.endswith('.json'):
-                continue
-            fpath = os.path.join(fp_path, fname)
-            try:
-                with open(fpath) as f:
-                    data = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                continue
-            for session in data.get('sessions', []):
-                host = session.get('host', '')
-                port = session.get('port', 0)
-                if host and port:
-                    alive.add(f"{host} {port}")
+        for session in data.get('sessions', []):
+            host = session.get('host', '')
+            port = session.get('port', 0)
+            if host and port:
+                alive.add(f"{host} {port}")
     return alive
 
 
 def detect_failure_reason(host, port, logs_dir):
     """Search the scan log for a failure reason.
 
+    Results are cached by log path and modification time, so repeated
+    lookups within one session do not re-read an unchanged log.
+
     :param host: server hostname
     :param port: server port
     :param logs_dir: directory containing scan log files
     :returns: human-readable reason string
     """
     logfile = os.path.join(str(logs_dir), f"{host}:{port}.log")
-    if not os.path.isfile(logfile):
-        return "no log file"
     try:
-        with open(logfile, errors='replace') as f:
-            content = f.read()
+        st = os.stat(logfile)
     except OSError:
         return "no log file"
+    if not stat.S_ISREG(st.st_mode):
+        return "no log file"
+    return _detect_failure_reason_cached(
+        logfile, st.st_mtime_ns, st.st_size)
+
 
-    lower = content.lower()
-    if "timed out" in lower:
-        return "connection timed out"
-    if "connection refused" in lower:
-        return "connection refused"
-    if re.search(r"no address.*associated|name or service not known"
-                 r"|name.*not resolve|getaddrinfo", lower):
-        return "DNS resolution failed"
-    if "network is unreachable" in lower or "no route to host" in lower:
-        return "network unreachable"
-    if re.search(r"error|exception|fail", lower):
-        return "error (see log)"
+@functools.lru_cache(maxsize=4096)
+def _detect_failure_reason_cached(logfile, mtime_ns, size):
+    """Classify a scan log; *mtime_ns* and *size* key the cache.
+
+    The log is memory-mapped and searched in place, without copying
+    or decoding it.
+    """
+    if not size:
+        return "no fingerprint data"
+    try:
+        fd = os.open(logfile, os.O_RDONLY)
+    except OSError:
+        return "no log file"
+    try:
+        with mmap.mmap(
+                fd, 0, prot=mmap.PROT_READ,
+                flags=mmap.MAP_SHARED | _MAP_POPULATE) as mm:
+            for reason, pattern in _FAILURE_PATTERNS:
+                if pattern.search(mm):
+                    return reason
+    except (OSError, ValueError):
+        return "no log file"
+    finally:
+        os.close(fd)
     return "no fingerprint data"
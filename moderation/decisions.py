@@ -1,8 +1,14 @@
 """Decision cache for moderation sessions."""
 
 import json
-import os
-from pathlib import Path
+import operator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .data import _replace_file
 
 
 def load_decisions(path):
@@ -17,7 +23,10 @@ def load_decisions(path):
     except (OSError, json.JSONDecodeError):
         data = {}
     data.setdefault("cross", {})
-    data.setdefault("dupes", {})
+    data["dupes"] = {
+        _parse_group_key(key): value
+        for key, value in data.get("dupes", {}).items()
+    }
     data.setdefault("dns", {})
     data.setdefault("rejected", {"mud": {}, "bbs": {}})
     return data
@@ -29,11 +38,19 @@ def save_decisions(path, decisions):
     :param path: path to write the decisions file
     :param decisions: dict with ``"cross"`` and ``"dupes"`` keys
     """
-    output = Path(str(path) + ".new")
-    with open(output, "w", encoding="utf-8") as f:
-        json.dump(decisions, f, indent=2, sort_keys=True)
-        f.write("\n")
-    os.replace(output, path)
+    decisions = dict(decisions)
+    decisions["dupes"] = {
+        _format_group_key(key): value
+        for key, value in decisions.get("dupes", {}).items()
+    }
+    if orjson is not None:
+        payload = orjson.dumps(
+            decisions, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+    else:
+        # ensure_ascii=False matches orjson, which writes UTF-8 as-is.
+        payload = json.dumps(decisions, indent=2, sort_keys=True,
+                             ensure_ascii=False).encode("utf-8")
+    _replace_file(path, payload + b"\n")
 
 
 def record_rejections(decisions, list_name, removals, reason):
@@ -51,11 +68,41 @@ def record_rejections(decisions, list_name, removals, reason):
         bucket[f"{host}:{port}"] = reason
 
 
+_HOST_PORT = operator.attrgetter("host", "port")
+
+
 def _group_cache_key(members):
     """Create a stable cache key from a group of records.
 
-    :param members: list of record dicts with ``host`` and ``port`` keys
-    :returns: string key (sorted ``host:port`` pairs joined by ``|``)
+    :param members: list of records with ``host`` and ``port`` attributes
+    :returns: sorted tuple of ``(host, port)`` pairs
+    """
+    return tuple(sorted(map(_HOST_PORT, members)))
+
+
+def _parse_group_key(text):
+    """Parse a stored group key into the form of :func:`_group_cache_key`.
+
+    :param text: ``host:port`` pairs joined by ``|``
+    :returns: tuple of ``(host, port)`` pairs, or *text* unchanged if it
+        is malformed
+    """
+    pairs = []
+    for part in text.split("|"):
+        host, _, port = part.rpartition(":")
+        if not host or not port.isdigit():
+            return text
+        pairs.append((host, int(port)))
+    return tuple(sorted(pairs))
+
+
+def _format_group_key(key):
+    """Render a group key for the decisions file.
+
+    :param key: tuple from :func:`_group_cache_key`, or a string key
+        kept from a malformed entry
+    :returns: sorted ``host:port`` pairs joined by ``|``
     """
-    parts = sorted(f"{r['host']}:{r['port']}" for r in members)
-    return "|".join(parts)
+    if isinstance(key, str):
+        return key
+    return "|".join(sorted(f"{host}:{port}" for host, port in key))
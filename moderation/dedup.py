@@ -1,13 +1,19 @@
 """Duplicate grouping, interactive review, and dead-server pruning."""
 
 import collections
+import heapq
+import json
+import operator
 import os
 import re
 import sys
+import time
 from pathlib import Path
 
 from .data import (
     _parse_host_port_set,
+    _read_json,
+    _replace_file,
     build_alive_set,
     deduplicate_records,
     detect_failure_reason,
@@ -26,43 +32,41 @@ from .util import (
 )
 
 
-def _find_fp_ip_groups(records):
-    """Group by (fingerprint, ip) -- strongest duplicate signal."""
-    groups = collections.defaultdict(list)
-    for rec in records:
-        if rec["fingerprint"] and rec["ip"]:
-            groups[(rec["fingerprint"], rec["ip"])].append(rec)
-    return {k: sorted(v, key=lambda r: (r["port"], r["host"]))
-            for k, v in groups.items() if len(v) > 1}
-
-
-def _find_banner_groups(records):
-    """Group by normalized banner hash."""
-    groups = collections.defaultdict(list)
-    for rec in records:
-        if rec["banner_hash"]:
-            groups[rec["banner_hash"]].append(rec)
-    return {k: sorted(v, key=lambda r: (r["port"], r["host"]))
-            for k, v in groups.items() if len(v) > 1}
+def _find_groups(records):
+    """Group records by each duplicate signal in a single pass.
 
+    Records are sorted by ``(port, host)`` once up front, so members of
+    every group come out in that order.
 
-def _find_mssp_groups(records):
-    """Group by normalized MSSP NAME."""
-    groups = collections.defaultdict(list)
-    for rec in records:
-        if rec["mssp_name"]:
-            key = _normalize_mssp_name(rec["mssp_name"])
-            groups[key].append(rec)
-    return {k: sorted(v, key=lambda r: (r["port"], r["host"]))
-            for k, v in groups.items() if len(v) > 1}
+    :param records: list of server records
+    :returns: tuple of three dicts of group key -> members with more
+        than one member: by ``(fingerprint, ip)``, the strongest
+        signal; by normalized banner hash; and by normalized MSSP NAME
+    """
+    by_fp_ip = collections.defaultdict(list)
+    by_banner = collections.defaultdict(list)
+    by_mssp = collections.defaultdict(list)
+    for rec in sorted(records, key=operator.attrgetter("port", "host")):
+        if rec.fingerprint and rec.ip:
+            by_fp_ip[(rec.fingerprint, rec.ip)].append(rec)
+        if rec.banner_hash:
+            by_banner[rec.banner_hash].append(rec)
+        if rec.mssp_name:
+            by_mssp[_normalize_mssp_name(rec.mssp_name)].append(rec)
+    return tuple(
+        {k: v for k, v in groups.items() if len(v) > 1}
+        for groups in (by_fp_ip, by_banner, by_mssp))
 
 
 def _subtract_covered(groups, covered):
-    """Remove already-covered (host, port) pairs from groups."""
+    """Remove already-covered records from groups.
+
+    :param groups: dict of group key -> list of server records
+    :param covered: bytearray flagging covered records by ``index``
+    """
     result = {}
     for key, members in groups.items():
-        remaining = [m for m in members
-                     if (m["host"], m["port"]) not in covered]
+        remaining = [m for m in members if not covered[m.index]]
         if len(remaining) > 1:
             result[key] = remaining
     return result
@@ -71,17 +75,17 @@ def _subtract_covered(groups, covered):
 def _print_group_member(idx, rec, removals, source_label=None):
     """Print one member of a duplicate group."""
     marker = (
-        "x" if (rec["host"], rec["port"]) in removals else " "
+        "x" if (rec.host, rec.port) in removals else " "
     )
     mssp = (
-        f"  name={rec['mssp_name']!r}" if rec["mssp_name"] else ""
+        f"  name={rec.mssp_name!r}" if rec.mssp_name else ""
     )
     source = f"  [{source_label}]" if source_label else ""
-    print(f"  [{marker}] {idx}. {rec['host']}:{rec['port']}"
-          f"  ip={rec['ip']}"
-          f"  fp={rec['fingerprint'][:12]}{mssp}{source}")
+    print(f"  [{marker}] {idx}. {rec.host}:{rec.port}"
+          f"  ip={rec.ip}"
+          f"  fp={rec.fingerprint[:12]}{mssp}{source}")
 
-    before = rec.get("banner_before", "")
+    before = rec.banner_before
     if before:
         displayed = _display_banner(before, maxlines=5)
         for line in displayed.splitlines():
@@ -89,44 +93,69 @@ def _print_group_member(idx, rec, removals, source_label=None):
     print()
 
 
+def _largest_groups(groups, limit=None):
+    """Order groups largest first, ties by group key.
+
+    :param groups: dict of group key -> list of server records
+    :param limit: keep only this many of the largest groups, or None
+    :returns: list of ``(key, members)`` pairs
+    """
+    def order(kv):
+        return (-len(kv[1]), kv[0])
+    if limit is not None and limit < len(groups):
+        return heapq.nsmallest(limit, groups.items(), key=order)
+    return sorted(groups.items(), key=order)
+
+
+def _groups_heading(label, groups, items):
+    """Format a group count heading, noting any ``--top-n`` limit."""
+    heading = f"{label}: {len(groups)} group(s)"
+    if len(items) < len(groups):
+        heading += f", showing the {len(items)} largest"
+    return heading
+
+
 def _review_groups(groups, label, decisions=None, logs_dir=None,
-                   data_dir=None):
+                   data_dir=None, limit=None):
     """Interactive review of duplicate groups.
 
-    :param groups: dict of group key -> list of record dicts
+    :param groups: dict of group key -> list of server records
     :param label: display label for the group type
     :param decisions: mutable decisions dict for caching, or None
     :param logs_dir: path to logs directory for rescan, or None
     :param data_dir: path to data directory (for JSON expunge)
+    :param limit: review only this many of the largest groups, or None
     :returns: set of (host, port) to remove
     """
     removals = set()
-    items = sorted(
-        groups.items(), key=lambda kv: (-len(kv[1]), kv[0]))
+    items = _largest_groups(groups, limit)
     dupes_cache = (decisions or {}).get("dupes", {})
     cached_count = 0
 
     print(f"\n{'=' * 70}")
-    print(f"  {label}: {len(items)} group(s)")
+    print(f"  {_groups_heading(label, groups, items)}")
     print(f"{'=' * 70}")
 
     for idx, (key, members) in enumerate(items, 1):
-        cache_key = _group_cache_key(members)
-        cached = dupes_cache.get(cache_key)
+        # Decisions double as pre-answered input: cached groups are
+        # resolved here, before anything is printed or prompted.
+        cache_key = None
+        cached = None
+        if decisions is not None:
+            cache_key = _group_cache_key(members)
+            cached = dupes_cache.get(cache_key)
 
         if cached is not None:
             action = cached.get("action", "")
             if action == "skip":
                 cached_count += 1
                 continue
-            if action == "remove":
+            candidates = cached.get("remove")
+            if action == "remove" and candidates:
                 member_set = {
-                    f"{r['host']}:{r['port']}" for r in members
+                    f"{r.host}:{r.port}" for r in members
                 }
-                valid = [
-                    hp for hp in cached.get("remove", [])
-                    if hp in member_set
-                ]
+                valid = [hp for hp in candidates if hp in member_set]
                 if valid:
                     for hp in valid:
                         h, _, p = hp.rpartition(":")
@@ -157,7 +186,7 @@ def _review_groups(groups, label, decisions=None, logs_dir=None,
         if choice == "*":
             if logs_dir:
                 servers = [
-                    (r['host'], r['port']) for r in members
+                    (r.host, r.port) for r in members
                 ]
                 deleted_logs = _expunge_logs(logs_dir, servers)
                 deleted_json = 0
@@ -182,12 +211,12 @@ def _review_groups(groups, label, decisions=None, logs_dir=None,
                 num = int(token)
                 if 1 <= num <= len(members):
                     rec = members[num - 1]
-                    removals.add((rec["host"], rec["port"]))
+                    removals.add((rec.host, rec.port))
                     removed.append(
-                        f"{rec['host']}:{rec['port']}"
+                        f"{rec.host}:{rec.port}"
                     )
                     print(f"    -> remove"
-                          f" {rec['host']}:{rec['port']}")
+                          f" {rec.host}:{rec.port}")
             except ValueError:
                 continue
 
@@ -208,11 +237,10 @@ def _review_groups(groups, label, decisions=None, logs_dir=None,
     return removals
 
 
-def _report_groups(groups, label):
+def _report_groups(groups, label, limit=None):
     """Non-interactive report of duplicate groups."""
-    items = sorted(
-        groups.items(), key=lambda kv: (-len(kv[1]), kv[0]))
-    print(f"\n  {label}: {len(items)} group(s)")
+    items = _largest_groups(groups, limit)
+    print(f"\n  {_groups_heading(label, groups, items)}")
     for key, members in items:
         if isinstance(key, tuple):
             print(f"\n    fp={key[0][:12]}  ip={key[1]}:")
@@ -220,18 +248,18 @@ def _report_groups(groups, label):
             print(f"\n    {key}:")
         for rec in members:
             mssp = (
-                f"  name={rec['mssp_name']!r}"
-                if rec["mssp_name"] else ""
+                f"  name={rec.mssp_name!r}"
+                if rec.mssp_name else ""
             )
-            print(f"      {rec['host']}:{rec['port']}{mssp}")
+            print(f"      {rec.host}:{rec.port}{mssp}")
 
 
 def _prune_data_files(records, removals):
     """List and optionally delete data files for removed entries."""
     paths = set()
     for rec in records:
-        if (rec["host"], rec["port"]) in removals:
-            paths.add(rec["data_path"])
+        if (rec.host, rec.port) in removals:
+            paths.add(rec.data_path)
     if not paths:
         return
     print(f"\n{len(paths)} data file(s) for removed entries:")
@@ -240,18 +268,26 @@ def _prune_data_files(records, removals):
     answer = _prompt("\nDelete these data files? [y/N] ", "yn")
     if answer != "y":
         return
-    for p in paths:
-        try:
-            os.unlink(p)
+    by_parent = collections.defaultdict(list)
+    for p in sorted(paths):
+        by_parent[os.path.dirname(p)].append(p)
+    for parent, children in by_parent.items():
+        deleted = False
+        for p in children:
+            try:
+                os.unlink(p)
+            except OSError as err:
+                print(f"  error deleting {p}: {err}",
+                      file=sys.stderr)
+                continue
             print(f"  deleted {p}")
-            parent = Path(p).parent
+            deleted = True
+        # Remove the fingerprint directory once, if now empty.
+        if deleted:
             try:
-                parent.rmdir()
+                os.rmdir(parent)
             except OSError:
                 pass
-        except OSError as err:
-            print(f"  error deleting {p}: {err}",
-                  file=sys.stderr)
 
 
 def prune_dead(list_path, data_dir, logs_dir, report_only=False,
@@ -323,7 +359,7 @@ def prune_dead(list_path, data_dir, logs_dir, report_only=False,
 
 def find_duplicates(list_path, data_dir, report_only=False,
                     prune_data=False, dry_run=False,
-                    decisions=None, logs_dir=None):
+                    decisions=None, logs_dir=None, top_n=None):
     """Find and review duplicate entries within a single server list.
 
     :param list_path: path to server list file
@@ -333,6 +369,8 @@ def find_duplicates(list_path, data_dir, report_only=False,
     :param dry_run: if True, don't write changes
     :param decisions: mutable decisions dict for caching, or None
     :param logs_dir: path to logs directory for rescan, or None
+    :param top_n: show only this many of the largest groups of each
+        kind, or None for all
     :returns: set of (host, port) removed
     """
     list_path = Path(list_path)
@@ -343,29 +381,29 @@ def find_duplicates(list_path, data_dir, report_only=False,
     records = deduplicate_records(records)
 
     current_entries = _parse_host_port_set(list_path)
-    records = [r for r in records
-               if (r["host"].lower(), r["port"])
-               in current_entries]
+    records = [r for r in records if r.addr in current_entries]
 
     print(f"  {len(records)} unique host:port records")
 
     if not records:
         print("  No fingerprint data to analyze.")
         return set()
+    for i, rec in enumerate(records):
+        rec.index = i
 
-    fp_ip_groups = _find_fp_ip_groups(records)
-    banner_groups = _find_banner_groups(records)
-    mssp_groups = _find_mssp_groups(records)
+    fp_ip_groups, banner_groups, mssp_groups = _find_groups(records)
 
-    covered = set()
+    # Records are unique per (host, port) here, so a flag per record
+    # index stands in for a set of covered addresses.
+    covered = bytearray(len(records))
     for members in fp_ip_groups.values():
         for rec in members:
-            covered.add((rec["host"], rec["port"]))
+            covered[rec.index] = 1
 
     extra_banner = _subtract_covered(banner_groups, covered)
     for members in extra_banner.values():
         for rec in members:
-            covered.add((rec["host"], rec["port"]))
+            covered[rec.index] = 1
 
     extra_mssp = _subtract_covered(mssp_groups, covered)
 
@@ -385,30 +423,31 @@ def find_duplicates(list_path, data_dir, report_only=False,
 
     if report_only:
         if fp_ip_groups:
-            _report_groups(fp_ip_groups, "Fingerprint + IP")
+            _report_groups(fp_ip_groups, "Fingerprint + IP", top_n)
         if extra_banner:
-            _report_groups(extra_banner, "Banner similarity")
+            _report_groups(extra_banner, "Banner similarity", top_n)
         if extra_mssp:
-            _report_groups(extra_mssp, "MSSP NAME")
+            _report_groups(extra_mssp, "MSSP NAME", top_n)
         return set()
 
     removals = set()
     if fp_ip_groups:
         r = _review_groups(
             fp_ip_groups, "Fingerprint + IP duplicates",
-            decisions,
-            logs_dir=logs_dir, data_dir=str(data_dir))
+            decisions, logs_dir=logs_dir, data_dir=str(data_dir),
+            limit=top_n)
         removals.update(r)
     if extra_banner:
         r = _review_groups(
             extra_banner, "Banner similarity duplicates",
-            decisions,
-            logs_dir=logs_dir, data_dir=str(data_dir))
+            decisions, logs_dir=logs_dir, data_dir=str(data_dir),
+            limit=top_n)
         removals.update(r)
     if extra_mssp:
         r = _review_groups(
             extra_mssp, "MSSP NAME duplicates", decisions,
-            logs_dir=logs_dir, data_dir=str(data_dir))
+            logs_dir=logs_dir, data_dir=str(data_dir),
+            limit=top_n)
         removals.update(r)
 
     if not removals:
@@ -435,39 +474,46 @@ def find_duplicates(list_path, data_dir, report_only=False,
     return removals
 
 
-_BBS_HOST_RE = re.compile(
-    r'(bbs|synchro|board|commodore|c64|amiga|mystic'
-    r'|renegade|wwiv|telegard)', re.IGNORECASE)
+# Matched as substrings of the lowercase hostname.
+_BBS_HOST_TOKENS = (
+    "bbs", "synchro", "board", "commodore", "c64", "amiga", "mystic",
+    "renegade", "wwiv", "telegard",
+)
 _BBS_BANNER_RE = re.compile(
     r'(synchronet|mystic\s*bbs|renegade|wwiv|telegard'
     r'|maximus|wildcat|pcboard|remote\s*access'
     r'|oblivion/2|iniquity|enthral|daydream'
     r'|eclipse\s*bbs|\bBBS\b)', re.IGNORECASE)
+_search_bbs_banner = _BBS_BANNER_RE.search
+_BBS_ENCODINGS = frozenset(("cp437", "cp850", "petscii"))
 
 
-def _is_bbs_entry(host, port, bbs_lines, rec):
+def _is_bbs_entry(host, port, bbs_encodings, rec):
     """Determine whether a cross-list entry is a BBS.
 
     :param host: lowercase hostname
     :param port: port number
-    :param bbs_lines: dict ``{(host, port): line_text}`` from BBS list
-    :param rec: fingerprint record dict, or None
+    :param bbs_encodings: dict ``{(host, port): encoding}`` from the
+        BBS list, for entries that name an encoding
+    :param rec: :class:`~.data.ServerRecord`, or None
     :returns: True if entry looks like a BBS
     """
-    if _BBS_HOST_RE.search(host):
+    if any(token in host for token in _BBS_HOST_TOKENS):
         return True
-    bbs_line = bbs_lines.get((host, port), "")
-    parts = bbs_line.split()
-    if len(parts) > 2:
-        enc = parts[2].lower()
-        if enc in ("cp437", "cp850", "petscii"):
-            return True
-    if rec:
-        banner = ((rec.get("banner_before", "") or "")
-                  + (rec.get("banner_after", "") or ""))
-        if _BBS_BANNER_RE.search(banner):
-            return True
-    return False
+    if bbs_encodings.get((host, port)) in _BBS_ENCODINGS:
+        return True
+    return bool(rec and _search_bbs_banner(
+        rec.banner_before + rec.banner_after))
+
+
+def _load_records_by_addr(data_dir):
+    """Load the most recent record per server, keyed for list lookups.
+
+    :param data_dir: path containing a ``server/`` subdirectory
+    :returns: dict ``{(host.lower(), port): record}``
+    """
+    return {r.addr: r for r in deduplicate_records(
+        load_server_records(Path(data_dir)))}
 
 
 def _batch_cross_resolve(conflicts, mud_records, bbs_records,
@@ -484,32 +530,26 @@ def _batch_cross_resolve(conflicts, mud_records, bbs_records,
     When no scan data exists in the primary data dirs, the ``.bak``
     directories are checked as a fallback for banner analysis.
 
+    :param conflicts: sorted list of ``(host, port)`` in both lists
     :returns: (mud_removals, bbs_removals) sets
     """
-    # Load BBS list lines for encoding hints.
-    bbs_lines = {}
-    with open(bbs_list, encoding="utf-8") as f:
-        for line in f:
-            s = line.strip()
-            if not s or s.startswith("#"):
-                continue
-            parts = s.split()
-            if len(parts) >= 2:
-                try:
-                    port_n = int(parts[1])
-                    bbs_lines[(parts[0].lower(), port_n)] = s
-                except ValueError:
-                    pass
+    # Keep only the encoding column of the BBS list, as a hint.
+    bbs_encodings = {}
+    for host, port, line in load_server_list(bbs_list):
+        if host is not None:
+            parts = line.split(None, 3)
+            if len(parts) > 2:
+                bbs_encodings[(host.lower(), port)] = parts[2].lower()
 
     mud_removals = set()
     bbs_removals = set()
     keep_mud = []
     keep_bbs = []
 
-    for host, port in sorted(conflicts):
+    for host, port in conflicts:
         rec = (mud_records.get((host, port))
                or bbs_records.get((host, port)))
-        if _is_bbs_entry(host, port, bbs_lines, rec):
+        if _is_bbs_entry(host, port, bbs_encodings, rec):
             mud_removals.add((host, port))
             keep_bbs.append(f"{host}:{port}")
         else:
@@ -582,32 +622,33 @@ def find_cross_list_conflicts(mud_list, bbs_list, mud_data_dir,
     mud_set = _parse_host_port_set(mud_list)
     bbs_set = _parse_host_port_set(bbs_list)
 
-    conflicts = mud_set & bbs_set
+    # Every branch below walks the conflicts in order; sort them once.
+    conflicts = sorted(mud_set & bbs_set)
     if not conflicts:
         print("  No entries appear in both lists.")
         return set(), set()
 
     print(f"  {len(conflicts)} entries found in both lists")
 
-    mud_records = {
-        (r["host"].lower(), r["port"]): r
-        for r in deduplicate_records(
-            load_server_records(Path(mud_data_dir)))
-    }
-    bbs_records = {
-        (r["host"].lower(), r["port"]): r
-        for r in deduplicate_records(
-            load_server_records(Path(bbs_data_dir)))
-    }
+    # A conflict's record is looked up in the MUD data first, so BBS
+    # data is only loaded for conflicts that it lacks.
+    mud_records = _load_records_by_addr(mud_data_dir)
+    bbs_records = {}
+    if not mud_records.keys() >= set(conflicts):
+        if (os.path.realpath(mud_data_dir)
+                == os.path.realpath(bbs_data_dir)):
+            bbs_records = mud_records
+        else:
+            bbs_records = _load_records_by_addr(bbs_data_dir)
 
     if report_only:
-        for host, port in sorted(conflicts):
+        for host, port in conflicts:
             rec = (mud_records.get((host, port))
                    or bbs_records.get((host, port)))
-            fp = rec["fingerprint"][:12] if rec else "?"
+            fp = rec.fingerprint[:12] if rec else "?"
             mssp = ""
-            if rec and rec.get("mssp_name"):
-                mssp = f"  name={rec['mssp_name']!r}"
+            if rec and rec.mssp_name:
+                mssp = f"  name={rec.mssp_name!r}"
             print(f"    {host}:{port}  fp={fp}{mssp}")
         return set(), set()
 
@@ -621,7 +662,7 @@ def find_cross_list_conflicts(mud_list, bbs_list, mud_data_dir,
     cross_cache = (decisions or {}).get("cross", {})
     cached_count = 0
 
-    for idx, (host, port) in enumerate(sorted(conflicts), 1):
+    for idx, (host, port) in enumerate(conflicts, 1):
         cache_key = f"{host}:{port}"
         cached = cross_cache.get(cache_key)
 
@@ -639,12 +680,12 @@ def find_cross_list_conflicts(mud_list, bbs_list, mud_data_dir,
         rec = (mud_records.get((host, port))
                or bbs_records.get((host, port)))
         if rec:
-            fp = rec["fingerprint"][:12]
-            ip = rec["ip"]
-            mssp = (f"  name={rec['mssp_name']!r}"
-                    if rec.get("mssp_name") else "")
+            fp = rec.fingerprint[:12]
+            ip = rec.ip
+            mssp = (f"  name={rec.mssp_name!r}"
+                    if rec.mssp_name else "")
             print(f"  fp={fp}  ip={ip}{mssp}")
-            before = rec.get("banner_before", "")
+            before = rec.banner_before
             if before:
                 displayed = _display_banner(before, maxlines=8)
                 for line in displayed.splitlines():
@@ -715,8 +756,60 @@ def find_cross_list_conflicts(mud_list, bbs_list, mud_data_dir,
     return mud_removals, bbs_removals
 
 
+# Cached DNS answers are reused for a day; addresses rarely change.
+_DNS_CACHE_TTL = 24 * 60 * 60
+
+
+def _resolve_hostnames_cached(hostnames, cache):
+    """Resolve hostnames, reusing recent answers from *cache*.
+
+    :param hostnames: set of hostname strings
+    :param cache: mutable dict ``{host: {"ips": [...], "ts": epoch}}``,
+        updated in place with successful lookups only; entries for
+        hosts not in *hostnames* are dropped
+    :returns: dict mapping hostname to set of resolved IP strings
+    """
+    now = int(time.time())
+    resolved = {}
+    stale = []
+    for host in hostnames:
+        entry = cache.get(host)
+        if entry and now - entry.get("ts", 0) < _DNS_CACHE_TTL:
+            resolved[host] = set(entry.get("ips", ()))
+        else:
+            stale.append(host)
+    if resolved:
+        print(f"  {len(resolved)} hostnames from DNS cache",
+              file=sys.stderr)
+    if stale:
+        fresh = _resolve_hostnames(stale)
+        for host, ips in fresh.items():
+            # A failed lookup is retried next run rather than remembered.
+            if ips:
+                cache[host] = {"ips": sorted(ips), "ts": now}
+            else:
+                cache.pop(host, None)
+        resolved.update(fresh)
+    for host in set(cache) - hostnames:
+        del cache[host]
+    return resolved
+
+
+def _load_dns_cache(path):
+    """Load the DNS cache file, or an empty cache if it is unusable.
+
+    :param path: path to the cache file
+    :returns: dict ``{host: {"ips": [...], "ts": epoch}}``
+    """
+    try:
+        cache = _read_json(path)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
 def find_dns_duplicates(mud_list, bbs_list, report_only=False,
-                        dry_run=False):
+                        dry_run=False, cache_path=None):
     """Remove IP entries that duplicate a hostname entry.
 
     Resolves all hostnames from both lists, then removes IP entries
@@ -727,6 +820,9 @@ def find_dns_duplicates(mud_list, bbs_list, report_only=False,
     :param bbs_list: path to bbslist.txt
     :param report_only: if True, only print report
     :param dry_run: if True, don't write changes
+    :param cache_path: untracked JSON file caching resolved addresses
+        between runs, or None to resolve every hostname; the cache is
+        not saved if it cannot be written
     :returns: (mud_removals, bbs_removals) sets
     """
     mud_list = Path(mud_list)
@@ -765,7 +861,19 @@ def find_dns_duplicates(mud_list, bbs_list, report_only=False,
           f"{len(ip_entries)} IP entries")
 
     print("  Resolving hostnames ...", file=sys.stderr)
-    resolved = _resolve_hostnames(hostnames)
+    if cache_path is not None:
+        cache = _load_dns_cache(cache_path)
+        resolved = _resolve_hostnames_cached(hostnames, cache)
+        if not dry_run:
+            # The cache is an optimization only; a missing or read-only
+            # data directory must not abort DNS deduplication.
+            try:
+                _replace_file(cache_path, json.dumps(
+                    cache, sort_keys=True).encode() + b"\n")
+            except OSError as err:
+                print(f"  DNS cache not saved: {err}", file=sys.stderr)
+    else:
+        resolved = _resolve_hostnames(hostnames)
 
     ip_to_hostname = collections.defaultdict(list)
     for host, port, source in all_entries:
@@ -1,15 +1,24 @@
 """Encoding discovery, fix, review, and bulk operations."""
 
+import functools
+import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import wcwidth
 
 from make_stats.common import _strip_ansi
 
-from .data import load_server_list
+from .data import (
+    _PARALLEL_MIN_FILES,
+    _iter_json_paths,
+    _read_json,
+    _write_list_lines,
+    load_server_list,
+)
 from .util import _prompt
 
 
@@ -31,6 +40,52 @@ _UTF8_AS_CP437_RE = re.compile(
 )
 
 
+# Box Drawing and Block Elements, U+2500 through U+259F.
+_BOX_DRAWING_RE = re.compile('[\u2500-\u259f]')
+
+# Host and port columns of a server list line, capturing the third
+# (encoding) column when present.
+_LIST_COLUMNS_RE = re.compile(r'\s*\S+\s+\S+(?:\s+(\S+))?')
+
+
+@functools.lru_cache(maxsize=1)
+def _count_box_drawing(text):
+    """Count box-drawing and block-element characters in text.
+
+    The last result is cached, see :func:`_visible_text`.
+    """
+    return len(_BOX_DRAWING_RE.findall(text))
+
+
+@functools.lru_cache(maxsize=1)
+def _visible_text(banner):
+    """Return banner text with terminal sequences removed.
+
+    The detectors and :func:`discover_encoding_issues` each need the
+    visible text of the same banner in turn, so the last result is
+    cached rather than stripped again at every call site.
+
+    :param banner: banner text
+    :returns: text without escape sequences
+    """
+    return _strip_ansi(banner)
+
+
+def _count_utf8_as_cp437(banner):
+    """Count UTF-8-as-CP437 mojibake sequences in a banner.
+
+    Every match either starts with U+0393 or is the U+2229 U+2557
+    U+2510 trigram, so banners lacking both are answered by substring
+    tests without running the regex.
+
+    :param banner: banner text
+    :returns: number of non-overlapping :data:`_UTF8_AS_CP437_RE` matches
+    """
+    if '\u0393' not in banner and '\u2229\u2557\u2510' not in banner:
+        return 0
+    return _UTF8_AS_CP437_RE.subn('', banner)[1]
+
+
 def _find_best_encoding(text):
     """Find the encoding that produces the cleanest decode of text.
 
@@ -41,20 +96,25 @@ def _find_best_encoding(text):
     if not text or '\ufffd' not in text:
         return None, 0
 
-    candidates = ['cp437', 'cp850', 'atascii', 'iso-8859-1', 'ascii']
+    # 'ascii' is not a candidate: every U+FFFD already in text encodes
+    # to three non-ASCII bytes, so it can never score better.
+    candidates = ['cp437', 'cp850', 'atascii', 'iso-8859-1']
     best_encoding = None
     best_score = text.count('\ufffd')
 
+    try:
+        raw = text.encode('utf-8', errors='surrogateescape')
+    except UnicodeEncodeError:
+        return best_encoding, best_score
     for encoding in candidates:
         try:
-            raw = text.encode('utf-8', errors='surrogateescape')
             decoded = raw.decode(encoding, errors='replace')
-            score = decoded.count('\ufffd')
-            if score < best_score:
-                best_score = score
-                best_encoding = encoding
-        except (UnicodeDecodeError, UnicodeEncodeError, LookupError):
-            pass
+        except (UnicodeDecodeError, LookupError):
+            continue
+        score = decoded.count('\ufffd')
+        if score < best_score:
+            best_score = score
+            best_encoding = encoding
 
     return best_encoding, best_score
 
@@ -67,41 +127,35 @@ def _detect_utf8_as_cp437(banner, stored_encoding):
     multi-byte UTF-8 sequences are split into individual CP437 code
     points, producing characteristic mojibake.
 
-    Returns ``'utf-8'`` if re-encoding as CP437 and decoding as UTF-8
-    produces cleaner output, ``None`` otherwise.
+    Suggests ``'utf-8'`` if re-encoding as CP437 and decoding as UTF-8
+    produces cleaner output.
 
     :param banner: banner text as stored (decoded with wrong encoding)
     :param stored_encoding: the encoding used by the scanner
-    :returns: ``'utf-8'`` if UTF-8 mojibake detected, else ``None``
+    :returns: tuple of (``'utf-8'`` if UTF-8 mojibake detected, else
+        ``None``; mojibake pattern count)
     """
     if not banner or stored_encoding not in ('cp437', None):
-        return None
+        return None, 0
 
-    mojibake_hits = len(_UTF8_AS_CP437_RE.findall(banner))
+    mojibake_hits = _count_utf8_as_cp437(banner)
     if mojibake_hits < 3:
-        return None
+        return None, mojibake_hits
 
-    visible = _strip_ansi(banner)
+    visible = _visible_text(banner)
     try:
         raw = visible.encode('cp437', errors='replace')
         redecoded = raw.decode('utf-8', errors='replace')
     except (UnicodeDecodeError, UnicodeEncodeError):
-        return None
-
-    original_replacements = visible.count('\ufffd')
-    redecoded_replacements = redecoded.count('\ufffd')
+        return None, mojibake_hits
 
-    if redecoded_replacements >= mojibake_hits:
-        return None
+    if redecoded.count('\ufffd') >= mojibake_hits:
+        return None, mojibake_hits
 
-    box_drawing = sum(
-        1 for c in redecoded
-        if '\u2500' <= c <= '\u259f' or '\u2580' <= c <= '\u259f'
-    )
-    if box_drawing < 3:
-        return None
+    if _count_box_drawing(redecoded) < 3:
+        return None, mojibake_hits
 
-    return 'utf-8'
+    return 'utf-8', mojibake_hits
 
 
 def _detect_utf8_native(banner, stored_encoding, list_encoding,
@@ -129,14 +183,107 @@ def _detect_utf8_native(banner, stored_encoding, list_encoding,
     if not default_encoding or default_encoding == 'utf-8':
         return None
 
-    visible = _strip_ansi(banner)
-    box_count = sum(1 for c in visible if '\u2500' <= c <= '\u259f')
-    if box_count < 3:
+    if _count_box_drawing(_visible_text(banner)) < 3:
         return None
 
     return 'utf-8'
 
 
+def _scan_encoding_file(fpath, allowed_servers, list_encodings,
+                        default_encoding):
+    """Check one JSON fingerprint file for an encoding issue.
+
+    :param fpath: path to a server JSON file
+    :param allowed_servers: set of (host, port) in the server list
+    :param list_encodings: dict of (host, port) to list encoding
+    :param default_encoding: build default encoding, or None
+    :returns: issue dict as described by
+        :func:`discover_encoding_issues`, or None
+    """
+    # banner_analysis imports this module; import lazily to break the cycle.
+    from .banner_analysis import _measure_banner_columns
+
+    try:
+        data = _read_json(fpath)
+    except (json.JSONDecodeError, OSError):
+        return None
+
+    probe = data.get('server-probe', {})
+    sessions = data.get('sessions', [])
+    if not sessions:
+        return None
+
+    session = sessions[-1]
+    host = session.get('host', session.get('ip', 'unknown'))
+    port = session.get('port', 0)
+
+    if (host, port) not in allowed_servers:
+        return None
+
+    session_data = probe.get('session_data', {})
+    stored_enc = session_data.get('encoding')
+    list_enc = list_encodings.get((host, port))
+    banner_before = session_data.get(
+        'banner_before_return', '')
+    banner_after = session_data.get(
+        'banner_after_return', '')
+    after_stripped = _strip_ansi(banner_after).strip()
+    if (banner_before and after_stripped
+            and after_stripped not in
+            _strip_ansi(banner_before)):
+        banner = (banner_before.rstrip()
+                  + '\r\n' + banner_after.lstrip())
+    else:
+        banner = banner_before or banner_after
+
+    max_width, _ = _measure_banner_columns(banner)
+
+    utf8_suggest, mojibake_count = _detect_utf8_as_cp437(
+        banner, stored_enc)
+    if utf8_suggest:
+        return {
+            'host': host,
+            'port': port,
+            'suggested_encoding': utf8_suggest,
+            'replacement_count': mojibake_count,
+            'reason': 'utf8_mojibake',
+            'list_already_correct':
+                list_enc == utf8_suggest,
+        }
+
+    utf8_native = _detect_utf8_native(
+        banner, stored_enc, list_enc, default_encoding)
+    if utf8_native:
+        box_count = _count_box_drawing(_visible_text(banner))
+        return {
+            'host': host,
+            'port': port,
+            'suggested_encoding': utf8_native,
+            'replacement_count': box_count,
+            'reason': 'utf8_native',
+            'list_already_correct': False,
+        }
+
+    if list_enc and stored_enc and list_enc != stored_enc:
+        return None
+
+    if max_width < 80 or max_width >= 200:
+        return None
+
+    suggested_enc, replacement_count = _find_best_encoding(
+        banner)
+    if suggested_enc and replacement_count > 0:
+        return {
+            'host': host,
+            'port': port,
+            'suggested_encoding': suggested_enc,
+            'replacement_count': replacement_count,
+            'list_already_correct':
+                list_enc == suggested_enc,
+        }
+    return None
+
+
 def discover_encoding_issues(data_dir='.', list_path=None,
                              default_encoding=None):
     """Scan JSON fingerprint data to find servers with encoding issues.
@@ -148,157 +295,36 @@ def discover_encoding_issues(data_dir='.', list_path=None,
         by re-decoding
     :returns: list of dicts with host, port, suggested_encoding
     """
-    import json
-    from .banner_analysis import _measure_banner_columns
-
     issues = []
     server_dir = os.path.join(data_dir, 'server')
     if not os.path.isdir(server_dir):
         return issues
 
-    list_entries = load_server_list(list_path)
-    allowed_servers = {(h, p) for h, p, _ in list_entries if h and p}
+    # The third column is an encoding, or a column width when numeric.
+    allowed_servers = set()
     list_encodings = {}
-    for h, p, line in list_entries:
+    for h, p, line in load_server_list(list_path):
         if h and p:
-            parts = line.split()
-            if len(parts) >= 3:
-                try:
-                    int(parts[2])
-                except ValueError:
-                    list_encodings[(h, p)] = parts[2]
-
-    for fp_dir in sorted(os.listdir(server_dir)):
-        fp_path = os.path.join(server_dir, fp_dir)
-        if not os.path.isdir(fp_path):
-            continue
-        for fname in sorted(os.listdir(fp_path)):
-            if not fname.endswith('.json'):
-                continue
-            fpath = os.path.join(fp_path, fname)
-            try:
-                with open(fpath, encoding='utf-8',
-                          errors='surrogateescape') as f:
-                    data = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                continue
-
-            probe = data.get('server-probe', {})
-            sessions = data.get('sessions', [])
-            if not sessions:
-                continue
-
-            session = sessions[-1]
-            host = session.get('host', session.get('ip', 'unknown'))
-            port = session.get('port', 0)
-
-            if (host, port) not in allowed_servers:
-                continue
-
-            session_data = probe.get('session_data', {})
-            stored_enc = session_data.get('encoding')
-            list_enc = list_encodings.get((host, port))
-            banner_before = session_data.get(
-                'banner_before_return', '')
-            banner_after = session_data.get(
-                'banner_after_return', '')
-            after_stripped = _strip_ansi(banner_after).strip()
-            if (banner_before and after_stripped
-                    and after_stripped not in
-                    _strip_ansi(banner_before)):
-                banner = (banner_before.rstrip()
-                          + '\r\n' + banner_after.lstrip())
-            else:
-                banner = banner_before or banner_after
-
-            max_width, _ = _measure_banner_columns(banner)
-
-            utf8_suggest = _detect_utf8_as_cp437(
-                banner, stored_enc)
-            if utf8_suggest:
-                mojibake_count = len(
-                    _UTF8_AS_CP437_RE.findall(banner))
-                issues.append({
-                    'host': host,
-                    'port': port,
-                    'suggested_encoding': utf8_suggest,
-                    'replacement_count': mojibake_count,
-                    'reason': 'utf8_mojibake',
-                    'list_already_correct':
-                        list_enc == utf8_suggest,
-                })
-                continue
-
-            utf8_native = _detect_utf8_native(
-                banner, stored_enc, list_enc, default_encoding)
-            if utf8_native:
-                visible = _strip_ansi(banner)
-                box_count = sum(
-                    1 for c in visible
-                    if '\u2500' <= c <= '\u259f')
-                issues.append({
-                    'host': host,
-                    'port': port,
-                    'suggested_encoding': utf8_native,
-                    'replacement_count': box_count,
-                    'reason': 'utf8_native',
-                    'list_already_correct': False,
-                })
-                continue
-
-            if list_enc and stored_enc and list_enc != stored_enc:
-                continue
-
-            if max_width < 80 or max_width >= 200:
-                continue
-
-            suggested_enc, replacement_count = _find_best_encoding(
-                banner)
-            if suggested_enc and replacement_count > 0:
-                issues.append({
-                    'host': host,
-                    'port': port,
-                    'suggested_encoding': suggested_enc,
-                    'replacement_count': replacement_count,
-                    'list_already_correct':
-                        list_enc == suggested_enc,
-                })
+            allowed_servers.add((h, p))
+            parts = line.split(None, 3)
+            if len(parts) >= 3 and not parts[2].isdigit():
+                list_encodings[(h, p)] = parts[2]
+
+    paths = list(_iter_json_paths(server_dir, ordered=True))
+    scan = functools.partial(
+        _scan_encoding_file, allowed_servers=allowed_servers,
+        list_encodings=list_encodings,
+        default_encoding=default_encoding)
+    if len(paths) < _PARALLEL_MIN_FILES:
+        results = map(scan, paths)
+    else:
+        with ProcessPoolExecutor() as pool:
+            results = list(pool.map(scan, paths, chunksize=32))
+    issues.extend(issue for issue in results if issue is not None)
 
     return issues
 
 
-def _apply_encoding_fix(list_path, host, port, encoding,
-                        dry_run=False):
-    """Update a single server's encoding in the list file.
-
-    :param list_path: path to server list file
-    :param host: server hostname
-    :param port: server port
-    :param encoding: new encoding value
-    :param dry_run: if True, don't write
-    :returns: True if the entry was found and updated
-    """
-    entries = load_server_list(list_path)
-    updated = False
-    new_entries = []
-    for h, p, line in entries:
-        if h == host and p == port:
-            parts = line.split()
-            if len(parts) >= 4:
-                parts[2] = encoding
-            elif len(parts) >= 2:
-                parts[2:] = [encoding]
-            new_entries.append((h, p, ' '.join(parts)))
-            updated = True
-        else:
-            new_entries.append((h, p, line))
-    if updated and not dry_run:
-        with open(list_path, 'w', encoding='utf-8') as f:
-            for _, _, line in new_entries:
-                f.write(line + '\n')
-    return updated
-
-
 def _apply_encoding_fixes_bulk(list_path, fixes, dry_run=False):
     """Update encodings for multiple servers in one write.
 
@@ -306,26 +332,30 @@ def _apply_encoding_fixes_bulk(list_path, fixes, dry_run=False):
     :param fixes: dict mapping (host, port) to new encoding
     :param dry_run: if True, don't write
     :returns: number of entries updated
+
+    The encoding column of each matched line is replaced in place,
+    keeping the line's original whitespace; lines that already carry
+    the requested encoding are left untouched.
     """
-    entries = load_server_list(list_path)
     updated = 0
-    new_entries = []
-    for h, p, line in entries:
-        if (h, p) in fixes:
-            parts = line.split()
-            enc = fixes[(h, p)]
-            if len(parts) >= 4:
-                parts[2] = enc
-            elif len(parts) >= 2:
-                parts[2:] = [enc]
-            new_entries.append((h, p, ' '.join(parts)))
+    changed = False
+    lines = []
+    for h, p, line in load_server_list(list_path):
+        enc = fixes.get((h, p))
+        if enc is not None:
             updated += 1
-        else:
-            new_entries.append((h, p, line))
-    if updated and not dry_run:
-        with open(list_path, 'w', encoding='utf-8') as f:
-            for _, _, line in new_entries:
-                f.write(line + '\n')
+            match = _LIST_COLUMNS_RE.match(line)
+            if match.group(1) is None:
+                end = match.end()
+                line = f"{line[:end]} {enc}{line[end:]}"
+                changed = True
+            elif match.group(1) != enc:
+                start, end = match.span(1)
+                line = f"{line[:start]}{enc}{line[end:]}"
+                changed = True
+        lines.append(line)
+    if changed and not dry_run:
+        _write_list_lines(list_path, lines)
     return updated
 
 
@@ -345,6 +375,25 @@ def _expunge_logs(logs_dir, servers):
     return deleted
 
 
+def _json_matches_servers(fpath, target):
+    """Whether a JSON fingerprint file has a session for any target server.
+
+    :param fpath: path to a server JSON file
+    :param target: set of (host, port) tuples
+    :returns: True if any session matches; False if unreadable
+    """
+    try:
+        data = _read_json(fpath)
+    except (OSError, json.JSONDecodeError):
+        return False
+    for session in data.get('sessions', []):
+        host = session.get('host', session.get('ip', ''))
+        port = session.get('port', 0)
+        if (host, port) in target:
+            return True
+    return False
+
+
 def _expunge_server_json(data_dir, servers):
     """Delete JSON fingerprint data files for a list of servers.
 
@@ -357,7 +406,6 @@ def _expunge_server_json(data_dir, servers):
     :param servers: iterable of (host, port) tuples
     :returns: number of JSON files deleted
     """
-    import json
     target = set(servers)
     if not target:
         return 0
@@ -365,34 +413,29 @@ def _expunge_server_json(data_dir, servers):
     if not os.path.isdir(server_dir):
         return 0
 
-    deleted = 0
-    empty_dirs = []
-    for fp_dir in os.listdir(server_dir):
-        fp_path = os.path.join(server_dir, fp_dir)
-        if not os.path.isdir(fp_path):
-            continue
-        for fname in os.listdir(fp_path):
-            if not fname.endswith('.json'):
-                continue
-            fpath = os.path.join(fp_path, fname)
-            try:
-                with open(fpath, encoding='utf-8',
-                          errors='surrogateescape') as f:
-                    data = json.load(f)
-            except (OSError, json.JSONDecodeError):
-                continue
-            for session in data.get('sessions', []):
-                host = session.get('host', session.get('ip', ''))
-                port = session.get('port', 0)
-                if (host, port) in target:
-                    os.remove(fpath)
-                    deleted += 1
-                    break
-        remaining = [
-            f for f in os.listdir(fp_path) if f.endswith('.json')
-        ]
-        if not remaining:
-            empty_dirs.append(fp_path)
+    dir_paths = {}
+    with os.scandir(server_dir) as it:
+        fp_paths = [e.path for e in it if e.is_dir()]
+    for fp_path in fp_paths:
+        with os.scandir(fp_path) as it:
+            dir_paths[fp_path] = [
+                e.path for e in it if e.name.endswith('.json')]
+    paths = [p for json_paths in dir_paths.values() for p in json_paths]
+
+    match = functools.partial(_json_matches_servers, target=target)
+    if len(paths) < _PARALLEL_MIN_FILES:
+        matched = [p for p in paths if match(p)]
+    else:
+        with ProcessPoolExecutor() as pool:
+            matched = [p for p, hit in zip(
+                paths, pool.map(match, paths, chunksize=32)) if hit]
+
+    for fpath in matched:
+        os.remove(fpath)
+    deleted = len(matched)
+    matched = set(matched)
+    empty_dirs = [fp_path for fp_path, json_paths in dir_paths.items()
+                  if all(p in matched for p in json_paths)]
 
     for d in empty_dirs:
         try:
@@ -584,6 +627,10 @@ def review_encoding_issues(mud_issues, bbs_issues, mud_list,
                         list_path, fixes, dry_run=dry_run)
                     applied_count += result
 
+        # Prompt for every server first, then rewrite the list and
+        # expunge stale data once for all accepted fixes.
+        accepted = {}
+        quit_review = False
         for issue in other:
             host = issue['host']
             port = issue['port']
@@ -599,28 +646,33 @@ def review_encoding_issues(mud_issues, bbs_issues, mud_list,
             choice = _prompt(
                 f"    Apply {suggested}? (y/n/q) ", "ynq")
             if choice == 'q':
-                return applied_count
-            if choice != 'y':
-                continue
-
-            if _apply_encoding_fix(
-                    list_path, host, port, suggested,
-                    dry_run=dry_run):
-                if not dry_run:
-                    print(f"    Updated"
-                          f" {os.path.basename(list_path)}")
+                quit_review = True
+                break
+            if choice == 'y':
+                accepted[(host, port)] = suggested
+
+        if accepted:
+            listed = {(h, p) for h, p, _ in load_server_list(list_path)}
+            accepted = {key: enc for key, enc in accepted.items()
+                        if key in listed}
+            updated = _apply_encoding_fixes_bulk(
+                list_path, accepted, dry_run=dry_run)
+            if updated and not dry_run:
+                print(f"\n  Updated {updated} entries in"
+                      f" {os.path.basename(list_path)}")
+                for host, port in accepted:
                     log_file = os.path.join(
                         logs_dir, f"{host}:{port}.log")
                     if os.path.isfile(log_file):
                         os.remove(log_file)
                         print(f"    Deleted {log_file}")
-                    if data_dir:
-                        nj = _expunge_server_json(
-                            data_dir, [(host, port)])
-                        if nj:
-                            print(f"    Deleted {nj}"
-                                  f" data file(s)")
-                applied_count += 1
+                if data_dir:
+                    nj = _expunge_server_json(data_dir, accepted)
+                    if nj:
+                        print(f"    Deleted {nj} data file(s)")
+            applied_count += updated
+        if quit_review:
+            return applied_count
 
 
 def _entries_by_encoding(list_path, encoding):
@@ -635,57 +687,44 @@ def _entries_by_encoding(list_path, encoding):
     for host, port, line in load_server_list(list_path):
         if host is None:
             continue
-        parts = line.split()
-        entry_enc = parts[2] if len(parts) >= 3 else None
-        if entry_enc is not None:
-            try:
-                int(entry_enc)
-                entry_enc = None
-            except ValueError:
-                pass
+        parts = line.split(None, 3)
+        entry_enc = None
+        if len(parts) >= 3 and not parts[2].isdigit():
+            entry_enc = parts[2]
         if encoding == 'all' or entry_enc == encoding:
             result.append((host, port, entry_enc))
     return result
 
 
-def _load_banner_for(host, port, data_dir):
-    """Load the raw banner for a specific host:port from server data.
+def _load_banners(data_dir, wanted):
+    """Load the raw banners of the wanted servers in one pass.
+
+    The scan stops as soon as every wanted server has been seen.
 
-    :param host: server hostname or IP
-    :param port: server port number
     :param data_dir: path to data directory (containing ``server/``)
-    :returns: combined banner string, or empty string if not found
+    :param wanted: set of (host, port) tuples to load
+    :returns: dict mapping (host, port) to combined banner string,
+        from the first data file found for each server
     """
-    import json
-    server_dir = os.path.join(data_dir, 'server')
-    if not os.path.isdir(server_dir):
-        return ''
-    for fp_dir in os.listdir(server_dir):
-        fp_path = os.path.join(server_dir, fp_dir)
-        if not os.path.isdir(fp_path):
+    banners = {}
+    for fpath in _iter_json_paths(os.path.join(data_dir, 'server')):
+        if len(banners) == len(wanted):
+            break
+        try:
+            data = _read_json(fpath)
+        except (OSError, json.JSONDecodeError):
             continue
-        for fname in os.listdir(fp_path):
-            if not fname.endswith('.json'):
-                continue
-            fpath = os.path.join(fp_path, fname)
-            try:
-                with open(fpath, encoding='utf-8',
-                          errors='surrogateescape') as f:
-                    data = json.load(f)
-            except (OSError, json.JSONDecodeError):
-                continue
-            for session in data.get('sessions', []):
-                if (session.get('host') == host
-                        and session.get('port') == port):
-                    sd = data.get(
-                        'server-probe', {}
-                    ).get('session_data', {})
-                    before = sd.get(
-                        'banner_before_return', '')
-                    after = sd.get(
-                        'banner_after_return', '')
-                    return (before or '') + (after or '')
-    return ''
+        sd = data.get('server-probe', {}).get('session_data', {})
+        banner = None
+        for session in data.get('sessions', []):
+            key = (session.get('host'), session.get('port'))
+            if key in wanted and key not in banners:
+                if banner is None:
+                    before = sd.get('banner_before_return', '')
+                    after = sd.get('banner_after_return', '')
+                    banner = (before or '') + (after or '')
+                banners[key] = banner
+    return banners
 
 
 def show_all_banners(list_path, data_dir, encoding):
@@ -705,9 +744,11 @@ def show_all_banners(list_path, data_dir, encoding):
         return
 
     print(f"{len(entries)} entries with encoding {encoding!r}")
+    banners = _load_banners(
+        data_dir, {(host, port) for host, port, _ in entries})
     shown = 0
     for host, port, entry_enc in entries:
-        banner = _load_banner_for(host, port, data_dir)
+        banner = banners.get((host, port), '')
         if not banner:
             continue
         shown += 1
@@ -1,5 +1,7 @@
 """Shared utility functions for the moderation package."""
 
+import functools
+import hashlib
 import json
 import re
 import shutil
@@ -12,11 +14,14 @@ from pathlib import Path
 
 import wcwidth
 
-from make_stats.common import _strip_ansi
-
 _BAT = shutil.which("bat") or shutil.which("batcat")
 _JQ = shutil.which("jq")
 _DIGITS_RE = re.compile(r"\d+")
+# str.translate() table deleting ASCII digits, the only \d matches in
+# ASCII text.
+_ASCII_DIGITS = dict.fromkeys(range(ord("0"), ord("9") + 1))
+# Characters of a literal IPv4 or IPv6 address, see _is_ip_address().
+_IP_CHARS = frozenset("0123456789abcdefABCDEF.:")
 
 # Default paths relative to the package's parent (the project root).
 _HERE = Path(__file__).resolve().parent.parent
@@ -30,25 +35,40 @@ DEFAULT_DECISIONS = _HERE / "moderation_decisions.json"
 
 def _normalize_banner(text):
     """Normalize banner for comparison: strip ANSI, digits, whitespace."""
-    text = _strip_ansi(text)
-    text = _DIGITS_RE.sub("", text)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    text = wcwidth.strip_sequences(text)
+    if text.isascii():
+        text = text.translate(_ASCII_DIGITS)
+    else:
+        text = _DIGITS_RE.sub("", text)
+    # str.split() splits on the same characters as \s, collapsing and
+    # stripping whitespace in one pass.
+    return " ".join(text.split())
 
 
+@functools.lru_cache(maxsize=4096)
 def _banner_hash(text):
-    """Hash normalized banner text for grouping."""
-    import hashlib
+    """Hash normalized banner text for grouping.
+
+    Cached, as servers sharing a codebase or host often send the same
+    banner.
+
+    :param text: combined banner text
+    :returns: 16-character hex digest, or ``""`` for an empty banner
+    """
     normalized = _normalize_banner(text)
     if not normalized:
         return ""
-    return hashlib.sha256(
-        normalized.encode("utf-8", errors="replace")
-    ).hexdigest()[:16]
+    return hashlib.blake2b(
+        normalized.encode("utf-8", errors="replace"), digest_size=8
+    ).hexdigest()
 
 
+@functools.lru_cache(maxsize=8192)
 def _normalize_mssp_name(name):
-    """Normalize MSSP NAME for comparison."""
+    """Normalize MSSP NAME for comparison.
+
+    Cached, as one game's name repeats across many ports and hosts.
+    """
     return name.strip().lower()
 
 
@@ -74,7 +94,7 @@ def _print_json(label, data):
 
 def _display_banner(text, maxlines=8):
     """Format banner for compact display."""
-    text = _strip_ansi(text)
+    text = wcwidth.strip_sequences(text)
     lines = [line.strip() for line in text.splitlines() if line.strip()]
     if len(lines) > maxlines:
         shown = lines[:maxlines]
@@ -106,6 +126,10 @@ def _is_ip_address(host):
     :param host: hostname or IP string
     :returns: True if *host* is a valid IP address
     """
+    # Most hosts are names: rule them out without raising ValueError.
+    # An IPv6 scope ID after "%" may hold any character.
+    if "%" not in host and not _IP_CHARS.issuperset(host):
+        return False
     try:
         ipaddress.ip_address(host)
         return True
@@ -113,10 +137,11 @@ def _is_ip_address(host):
         return False
 
 
-def _resolve_hostnames(hostnames, workers=8):
+def _resolve_hostnames(hostnames, workers=32):
     """Resolve a collection of hostnames to their IP addresses.
 
-    Uses a thread pool with a small worker count to be gentle on DNS.
+    Lookups run in a thread pool, as each one mostly waits on the
+    resolver.  The worker count is capped to stay gentle on DNS.
 
     :param hostnames: iterable of hostname strings
     :param workers: number of parallel resolver threads
@@ -134,7 +159,9 @@ def _resolve_hostnames(hostnames, workers=8):
             return host, set()
 
     total = len(hostnames)
-    with ThreadPoolExecutor(max_workers=workers) as pool:
+    if not total:
+        return results
+    with ThreadPoolExecutor(max_workers=min(workers, total)) as pool:
         for done, (host, ips) in enumerate(
                 pool.map(_resolve, hostnames), 1):
             results[host] = ips
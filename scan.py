@@ -13,13 +13,15 @@ encodings like CP437.
 
 import argparse
 import os
-import random
+import queue
 import signal
 import subprocess
 import sys
 import threading
 import time
+import zlib
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain, zip_longest
 
 # Global state for clean shutdown on Ctrl+C.
 _shutdown = False
@@ -36,10 +38,7 @@ def parse_server_list(path):
     entries = []
     with open(path) as f:
         for line in f:
-            stripped = line.split('#')[0].strip()
-            if not stripped:
-                continue
-            parts = stripped.split()
+            parts = line.partition('#')[0].split(None, 3)
             if len(parts) < 2:
                 continue
             host = parts[0]
@@ -49,6 +48,24 @@ def parse_server_list(path):
     return entries
 
 
+def _interleave(entries, buckets=16):
+    """Reorder entries to spread scans of one host apart.
+
+    Entries are dealt into buckets by a stable hash of the hostname and
+    taken round-robin, so ports of the same host are launched about
+    *buckets* scans apart, in the same order on every run.
+
+    :param entries: list of (host, port, encoding) tuples
+    :param buckets: number of buckets to interleave
+    :returns: reordered list of entries
+    """
+    groups = [[] for _ in range(buckets)]
+    for entry in entries:
+        groups[zlib.crc32(entry[0].encode()) % buckets].append(entry)
+    return [entry for entry in chain.from_iterable(zip_longest(*groups))
+            if entry is not None]
+
+
 def _kill_process_group(proc):
     """Kill a subprocess and all of its children via process group.
 
@@ -69,7 +86,7 @@ def _kill_process_group(proc):
 
 
 def scan_host(host, port, data_dir, logs_dir, encoding=None,
-              banner_max_wait=20, connect_timeout=60):
+              banner_max_wait=20, connect_timeout=60, stale_log=True):
     """Scan a single server.
 
     :param host: server hostname
@@ -79,6 +96,8 @@ def scan_host(host, port, data_dir, logs_dir, encoding=None,
     :param encoding: optional encoding argument for telnetlib3-fingerprint
     :param banner_max_wait: seconds to wait for banner data
     :param connect_timeout: seconds to wait for TCP connection
+    :param stale_log: whether a log file from an earlier scan may exist
+        and must be removed first
     :returns: (host, port, status_message)
     """
     if _shutdown:
@@ -86,10 +105,11 @@ def scan_host(host, port, data_dir, logs_dir, encoding=None,
 
     logfile = os.path.join(logs_dir, f"{host}:{port}.log")
 
-    try:
-        os.remove(logfile)
-    except FileNotFoundError:
-        pass
+    if stale_log:
+        try:
+            os.remove(logfile)
+        except FileNotFoundError:
+            pass
 
     cmd = [
         "telnetlib3-fingerprint", host, port,
@@ -179,19 +199,23 @@ def main():
 
     os.makedirs(args.logs_dir, exist_ok=True)
 
-    entries = parse_server_list(args.list)
-    random.shuffle(entries)
+    entries = _interleave(parse_server_list(args.list))
 
     # Pre-filter: separate entries that need scanning from those
     # that will be skipped, so --connect-delay only affects real scans.
+    # Without --refresh, servers with a log are skipped, so none of the
+    # servers scanned has a stale log to remove.
+    existing_logs = set()
+    if not args.refresh:
+        with os.scandir(args.logs_dir) as it:
+            existing_logs = {e.name for e in it if e.is_file()}
     to_scan = []
     skipped = 0
     for host, port, encoding in entries:
         if not host or not port:
             print(f"{host}:{port} -- skip: empty host or port")
             skipped += 1
-        elif not args.refresh and os.path.isfile(
-                os.path.join(args.logs_dir, f"{host}:{port}.log")):
+        elif f"{host}:{port}.log" in existing_logs:
             print(f"{host}:{port} -- skip: already scanned")
             skipped += 1
         else:
@@ -241,21 +265,30 @@ def main():
     try:
         with ThreadPoolExecutor(max_workers=args.num_workers) as pool:
             futures = set()
+            # Futures are queued as they finish, so reporting them does
+            # not rescan every pending future after each launch.
+            completed = queue.SimpleQueue()
+            next_launch = time.monotonic()
             for host, port, encoding in to_scan:
                 if _shutdown:
                     break
                 future = pool.submit(
                     scan_host, host, port, args.data_dir, args.logs_dir,
                     encoding, args.banner_max_wait,
-                    args.connect_timeout)
+                    args.connect_timeout, stale_log=args.refresh)
                 future_to_server[future] = (host, port)
                 futures.add(future)
-                time.sleep(args.connect_delay)
+                future.add_done_callback(completed.put)
+                # Launch on a fixed schedule, counting the time spent
+                # submitting and reporting against the delay.
+                next_launch = max(next_launch + args.connect_delay,
+                                  time.monotonic())
+                time.sleep(max(0, next_launch - time.monotonic()))
                 # drain any futures that completed while we slept
-                done = {f for f in futures if f.done()}
-                for f in done:
+                while not completed.empty():
+                    f = completed.get()
                     _report(f)
-                futures -= done
+                    futures.discard(f)
 
             if _shutdown:
                 for f in futures:
@@ -61,6 +61,19 @@ class TestCache:
         assert not os.path.exists(cache_file + '.tmp')
         assert os.path.exists(cache_file)
 
+    def test_layout_without_orjson(self, tmp_path):
+        cache_file = tmp_path / 'cache.json'
+        data = {'2.2.2.2': {'country': 'FR', 'country_name': 'Côte',
+                             'ts': 1700000000},
+                '1.1.1.1': {'country': 'AU', 'country_name': 'Australia',
+                             'ts': 1700000000}}
+        with mock.patch('make_stats.geoip._CACHE_FILE', str(cache_file)):
+            _save_cache(data)
+            with_orjson = cache_file.read_bytes()
+            with mock.patch('make_stats.geoip.orjson', None):
+                _save_cache(data)
+        assert cache_file.read_bytes() == with_orjson
+
 
 class TestQueryBatch:
 
@@ -116,7 +129,7 @@ class TestLookupCountries:
         mock_response.raise_for_status = mock.Mock()
 
         with mock.patch('make_stats.geoip._CACHE_FILE', cache_file), \
-             mock.patch('make_stats.geoip.requests.post',
+             mock.patch('make_stats.geoip.requests.Session.post',
                         return_value=mock_response):
             lookup_countries(servers)
 
@@ -137,7 +150,7 @@ class TestLookupCountries:
         servers = [{'ip': '8.8.8.8', 'host': 'dns.google'}]
 
         with mock.patch('make_stats.geoip._CACHE_FILE', cache_file), \
-             mock.patch('make_stats.geoip.requests.post') as mock_post:
+             mock.patch('make_stats.geoip.requests.Session.post') as mock_post:
             lookup_countries(servers)
 
         mock_post.assert_not_called()
@@ -162,7 +175,7 @@ class TestLookupCountries:
         mock_response.raise_for_status = mock.Mock()
 
         with mock.patch('make_stats.geoip._CACHE_FILE', cache_file), \
-             mock.patch('make_stats.geoip.requests.post',
+             mock.patch('make_stats.geoip.requests.Session.post',
                         return_value=mock_response):
             lookup_countries(servers)
 
@@ -173,7 +186,7 @@ class TestLookupCountries:
         servers = [{'ip': '', 'host': 'noip.example'}]
 
         with mock.patch('make_stats.geoip._CACHE_FILE', cache_file), \
-             mock.patch('make_stats.geoip.requests.post') as mock_post:
+             mock.patch('make_stats.geoip.requests.Session.post') as mock_post:
             lookup_countries(servers)
 
         mock_post.assert_not_called()
@@ -194,7 +207,7 @@ class TestLookupCountries:
         mock_response.raise_for_status = mock.Mock()
 
         with mock.patch('make_stats.geoip._CACHE_FILE', cache_file), \
-             mock.patch('make_stats.geoip.requests.post',
+             mock.patch('make_stats.geoip.requests.Session.post',
                         return_value=mock_response) as mock_post:
             lookup_countries(servers)
 
@@ -0,0 +1,35 @@
+"""Tests for moderation.banner_analysis empty-banner discovery."""
+
+import json
+
+from moderation.banner_analysis import discover_empty_banners
+
+
+def _write_server(data_dir, name, banner_before):
+    fp_dir = data_dir / 'server' / 'fp1'
+    fp_dir.mkdir(parents=True, exist_ok=True)
+    (fp_dir / name).write_bytes(json.dumps({
+        'server-probe': {'fingerprint': 'fp1',
+                         'session_data': {'banner_before_return':
+                                          banner_before}},
+        'sessions': [{'host': name[:-5], 'port': 23}],
+    }, ensure_ascii=False).encode('utf-8'))
+
+
+class TestDiscoverEmptyBanners:
+
+    def _discover(self, tmp_path, banners):
+        list_path = tmp_path / 'list.txt'
+        list_path.write_text(''.join(f'{host} 23\n' for host in banners))
+        for host, banner in banners.items():
+            _write_server(tmp_path, f'{host}.json', banner)
+        return sorted(issue['host'] for issue in discover_empty_banners(
+            tmp_path, list_path, tmp_path / 'logs'))
+
+    def test_text_banner_skipped(self, tmp_path):
+        assert self._discover(tmp_path, {'a.com': 'Welcome'}) == []
+
+    def test_unicode_whitespace_is_empty(self, tmp_path):
+        assert self._discover(tmp_path, {
+            'a.com': '\u00a0\u3000', 'b.com': ' \r\n', 'c.com': '\u00e9',
+        }) == ['a.com', 'b.com']
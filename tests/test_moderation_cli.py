@@ -0,0 +1,18 @@
+"""Tests for moderation.cli argument parsing."""
+
+import pytest
+
+from moderation.cli import _get_argument_parser
+
+
+class TestTopN:
+
+    def test_positive_accepted(self):
+        args = _get_argument_parser().parse_args(['--top-n', '5'])
+        assert args.top_n == 5
+
+    @pytest.mark.parametrize('value', ['0', '-3', 'many'])
+    def test_non_positive_rejected(self, value, capsys):
+        with pytest.raises(SystemExit):
+            _get_argument_parser().parse_args(['--top-n', value])
+        assert 'must be a positive integer' in capsys.readouterr().err
@@ -0,0 +1,129 @@
+"""Tests for moderation.data list parsing and record loading."""
+
+import json
+import os
+
+from moderation.data import (
+    ServerRecord,
+    _invalidate_server_list,
+    deduplicate_records,
+    detect_failure_reason,
+    load_server_list,
+    load_server_records,
+)
+
+
+class TestLoadServerList:
+
+    def test_entries_and_comments(self, tmp_path):
+        p = tmp_path / 'list.txt'
+        p.write_text('# header\n\nexample.com 23\n'
+                     'test.org 4000 utf-8 90\n')
+        assert load_server_list(p) == [
+            (None, None, '# header'),
+            (None, None, ''),
+            ('example.com', 23, 'example.com 23'),
+            ('test.org', 4000, 'test.org 4000 utf-8 90'),
+        ]
+
+    def test_original_whitespace_preserved(self, tmp_path):
+        p = tmp_path / 'list.txt'
+        p.write_text('  host.com\t23  cp437\n')
+        assert load_server_list(p) == [
+            ('host.com', 23, '  host.com\t23  cp437'),
+        ]
+
+    def test_malformed_lines_kept_as_comments(self, tmp_path):
+        p = tmp_path / 'list.txt'
+        p.write_text('lonely.host\nbad.port 23x\n#commented 23\n')
+        assert load_server_list(p) == [
+            (None, None, 'lonely.host'),
+            (None, None, 'bad.port 23x'),
+            (None, None, '#commented 23'),
+        ]
+
+    def test_no_trailing_newline(self, tmp_path):
+        p = tmp_path / 'list.txt'
+        p.write_text('a.com 23\nb.com 24')
+        assert [h for h, _, _ in load_server_list(p)] == ['a.com', 'b.com']
+
+    def test_empty_file(self, tmp_path):
+        p = tmp_path / 'list.txt'
+        p.write_text('')
+        assert load_server_list(p) == []
+
+    def test_cache_invalidated_on_rewrite(self, tmp_path):
+        p = tmp_path / 'list.txt'
+        p.write_text('a.com 23 cp437\n')
+        st = os.stat(p)
+        assert load_server_list(p)[0][2] == 'a.com 23 cp437'
+        # Same size, same mtime: only explicit invalidation notices.
+        with open(p, 'w') as f:
+            f.write('a.com 23 utf-8\n')
+        os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns))
+        _invalidate_server_list(p)
+        assert load_server_list(p)[0][2] == 'a.com 23 utf-8'
+
+
+def _write_server(data_dir, fp, name, sessions, banner_before='',
+                  mssp=None):
+    fp_dir = data_dir / 'server' / fp
+    fp_dir.mkdir(parents=True, exist_ok=True)
+    session_data = {'banner_before_return': banner_before,
+                    'banner_after_return': ''}
+    if mssp is not None:
+        session_data['mssp'] = mssp
+    (fp_dir / name).write_text(json.dumps({
+        'server-probe': {'fingerprint': fp,
+                         'fingerprint-data': {},
+                         'session_data': session_data},
+        'sessions': sessions,
+    }))
+
+
+class TestLoadServerRecords:
+
+    def test_records_are_slotted(self, tmp_path):
+        _write_server(tmp_path, 'fp1', 'a.json',
+                      [{'host': 'A.com', 'port': 23, 'ip': '1.2.3.4'}])
+        (rec,) = load_server_records(tmp_path)
+        assert isinstance(rec, ServerRecord)
+        assert not hasattr(rec, '__dict__')
+        assert rec.addr == ('a.com', 23)
+
+    def test_dict_banner_unwrapped(self, tmp_path):
+        _write_server(tmp_path, 'fp1', 'a.json',
+                      [{'host': 'a.com', 'port': 23}],
+                      banner_before={'text': 'Welcome'},
+                      mssp={'NAME': 'Game'})
+        (rec,) = load_server_records(tmp_path)
+        assert rec.banner_before == 'Welcome'
+        assert rec.banner_hash
+        assert rec.mssp_name == 'Game'
+
+    def test_deduplicate_keeps_latest(self, tmp_path):
+        _write_server(tmp_path, 'fp1', 'a.json', [
+            {'host': 'a.com', 'port': 23, 'connected': '2024-01-01'}])
+        _write_server(tmp_path, 'fp2', 'b.json', [
+            {'host': 'a.com', 'port': 23, 'connected': '2025-01-01'}])
+        (rec,) = deduplicate_records(load_server_records(tmp_path))
+        assert rec.fingerprint == 'fp2'
+
+
+class TestDetectFailureReason:
+
+    def _log(self, tmp_path, text):
+        (tmp_path / 'a.com:23.log').write_text(text)
+        return detect_failure_reason('a.com', 23, tmp_path)
+
+    def test_missing_log(self, tmp_path):
+        assert detect_failure_reason('a.com', 23, tmp_path) == 'no log file'
+
+    def test_priority_on_one_line(self, tmp_path):
+        assert self._log(
+            tmp_path, 'hostname lookup timed out: could not resolve\n'
+        ) == 'connection timed out'
+
+    def test_dns_does_not_span_lines(self, tmp_path):
+        assert self._log(
+            tmp_path, 'name lookup\nnot resolved\n') == 'no fingerprint data'
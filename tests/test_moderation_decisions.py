@@ -0,0 +1,66 @@
+"""Tests for moderation.decisions cache keys and persistence."""
+
+import types
+
+from moderation.decisions import (
+    _format_group_key,
+    _group_cache_key,
+    _parse_group_key,
+    load_decisions,
+    save_decisions,
+)
+
+
+def _rec(host, port):
+    return types.SimpleNamespace(host=host, port=port)
+
+
+class TestGroupCacheKey:
+
+    def test_independent_of_member_order(self):
+        a = [_rec('b.com', 23), _rec('a.com', 4000)]
+        assert _group_cache_key(a) == _group_cache_key(a[::-1])
+
+    def test_format_matches_stored_form(self):
+        key = _group_cache_key([_rec('b.com', 23), _rec('a.com', 4000)])
+        assert _format_group_key(key) == 'a.com:4000|b.com:23'
+
+    def test_parse_round_trip(self):
+        text = '1.2.3.4:23|a.com:6000|a.com:6023'
+        key = _parse_group_key(text)
+        assert key == _group_cache_key([
+            _rec('a.com', 6023), _rec('1.2.3.4', 23), _rec('a.com', 6000)])
+        assert _format_group_key(key) == text
+
+    def test_malformed_key_kept_as_text(self):
+        assert _parse_group_key('a.com|b.com:23') == 'a.com|b.com:23'
+        assert _format_group_key('a.com|b.com:23') == 'a.com|b.com:23'
+
+
+class TestSaveDecisions:
+
+    def test_file_round_trip(self, tmp_path):
+        path = tmp_path / 'decisions.json'
+        path.write_text(
+            '{\n  "cross": {},\n  "dns": {},\n  "dupes": {\n'
+            '    "a.com:23|b.com:23": {\n      "action": "skip"\n    }\n'
+            '  },\n  "rejected": {\n    "bbs": {},\n    "mud": {}\n  }\n}\n')
+        decisions = load_decisions(path)
+        assert (('a.com', 23), ('b.com', 23)) in decisions['dupes']
+        original = path.read_bytes()
+        save_decisions(path, decisions)
+        assert path.read_bytes() == original
+
+    def test_missing_file(self, tmp_path):
+        decisions = load_decisions(tmp_path / 'missing.json')
+        assert decisions['dupes'] == {}
+        assert decisions['rejected'] == {'mud': {}, 'bbs': {}}
+
+    def test_unchanged_save_skips_write(self, tmp_path):
+        path = tmp_path / 'decisions.json'
+        save_decisions(path, load_decisions(path))
+        inode = path.stat().st_ino
+        save_decisions(path, load_decisions(path))
+        assert path.stat().st_ino == inode
+        save_decisions(path, {'cross': {'a.com:23': 'mud'}})
+        assert path.stat().st_ino != inode
@@ -0,0 +1,55 @@
+"""Tests for moderation.dedup DNS deduplication."""
+
+import json
+
+from moderation import dedup
+
+
+class TestFindDnsDuplicates:
+
+    def _lists(self, tmp_path):
+        mud = tmp_path / 'mudlist.txt'
+        bbs = tmp_path / 'bbslist.txt'
+        mud.write_text('a.com 23\n1.2.3.4 23\n')
+        bbs.write_text('gone.org 23\n')
+        return mud, bbs
+
+    def test_cache_file_written(self, tmp_path, monkeypatch):
+        mud, bbs = self._lists(tmp_path)
+        monkeypatch.setattr(dedup, '_resolve_hostnames', lambda hosts: {
+            'a.com': {'1.2.3.4'}, 'gone.org': set()})
+        cache_path = tmp_path / '.dns_cache.json'
+        mud_rm, bbs_rm = dedup.find_dns_duplicates(
+            mud, bbs, cache_path=cache_path)
+        assert (mud_rm, bbs_rm) == ({('1.2.3.4', 23)}, set())
+        cache = json.loads(cache_path.read_text())
+        assert list(cache) == ['a.com']
+        assert cache['a.com']['ips'] == ['1.2.3.4']
+        assert mud.read_text() == 'a.com 23\n'
+
+    def test_cached_answer_reused(self, tmp_path, monkeypatch):
+        mud, bbs = self._lists(tmp_path)
+        monkeypatch.setattr(dedup, '_resolve_hostnames', lambda hosts: {
+            'a.com': {'1.2.3.4'}, 'gone.org': set()})
+        cache_path = tmp_path / '.dns_cache.json'
+        dedup.find_dns_duplicates(mud, bbs, cache_path=cache_path)
+        mud, bbs = self._lists(tmp_path)
+        looked_up = []
+        monkeypatch.setattr(dedup, '_resolve_hostnames', lambda hosts: (
+            looked_up.extend(hosts) or {h: set() for h in hosts}))
+        mud_rm, _ = dedup.find_dns_duplicates(
+            mud, bbs, dry_run=True, cache_path=cache_path)
+        assert looked_up == ['gone.org']
+        assert mud_rm == {('1.2.3.4', 23)}
+
+    def test_missing_cache_dir(self, tmp_path, monkeypatch, capsys):
+        mud, bbs = self._lists(tmp_path)
+        monkeypatch.setattr(dedup, '_resolve_hostnames', lambda hosts: {
+            'a.com': {'1.2.3.4'}, 'gone.org': set()})
+        cache_path = tmp_path / 'no-data' / '.dns_cache.json'
+        mud_rm, _ = dedup.find_dns_duplicates(
+            mud, bbs, cache_path=cache_path)
+        assert mud_rm == {('1.2.3.4', 23)}
+        assert mud.read_text() == 'a.com 23\n'
+        assert not cache_path.parent.exists()
+        assert 'DNS cache not saved' in capsys.readouterr().err
@@ -0,0 +1,29 @@
+"""Tests for moderation.encoding list fixes."""
+
+from moderation.encoding import _apply_encoding_fixes_bulk
+
+
+class TestApplyEncodingFixesBulk:
+
+    def test_column_spliced_in_place(self, tmp_path):
+        p = tmp_path / 'list.txt'
+        p.write_text('# header\na.com\t23   cp437  90\nb.com 24\n')
+        fixes = {('a.com', 23): 'utf-8', ('b.com', 24): 'cp850'}
+        assert _apply_encoding_fixes_bulk(p, fixes) == 2
+        assert p.read_text() == (
+            '# header\na.com\t23   utf-8  90\nb.com 24 cp850\n')
+
+    def test_already_correct_not_rewritten(self, tmp_path):
+        p = tmp_path / 'list.txt'
+        p.write_text('a.com  23  utf-8\n')
+        mtime = p.stat().st_mtime_ns
+        assert _apply_encoding_fixes_bulk(p, {('a.com', 23): 'utf-8'}) == 1
+        assert p.read_text() == 'a.com  23  utf-8\n'
+        assert p.stat().st_mtime_ns == mtime
+
+    def test_dry_run(self, tmp_path):
+        p = tmp_path / 'list.txt'
+        p.write_text('a.com 23\n')
+        assert _apply_encoding_fixes_bulk(
+            p, {('a.com', 23): 'utf-8'}, dry_run=True) == 1
+        assert p.read_text() == 'a.com 23\n'